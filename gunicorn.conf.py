@@ -0,0 +1,16 @@
+# Production server settings, picked up automatically by `gunicorn main:server_app` from /app.
+# `python main.py` (uvicorn's own supervisor) stays the development entrypoint.
+import os
+
+bind = "0.0.0.0:8000"
+# UvicornWorker pinned to the same loop/parser/websocket settings as main.run()
+worker_class = "src.core.server_worker.AgentUvicornWorker"
+# One worker per core; each holds its own Temporal client and Redis subscription, and events
+# fan out to every worker through Redis pub/sub
+workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+# A busy worker is restarted by the arbiter instead of wedging the port
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+accesslog = None
+loglevel = "warning"
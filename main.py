@@ -1,23 +1,35 @@
 #!/usr/bin/env python3
 import asyncio
-import uuid
+import gzip
+import hashlib
+import os
+import secrets
+import sys
 import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import quote
+from typing import Any, AsyncIterator, Dict, NamedTuple, TypeVar
 from fastapi import FastAPI
-from fastapi import WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse, HTMLResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi import HTTPException
-from pydantic import BaseModel
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
+import orjson
 import uvicorn
 from dotenv import load_dotenv
-import yaml
+from watchfiles import awatch
+from temporalio.client import Client
 
 from src.core.logger import setup_logging
+from src.core.static_files import CachedStaticFiles
 from src.utils.config_loader import ConfigLoader
 from src.agents.human_io import human_broker
 from src.agents.tools import ToolEnv
 from src.core.temporal_client import get_temporal_client
-from src.core.events import subscribe_events
+from src.core.events import publish_event, subscribe_events
 from src.workflows.auth_workflow import AuthenticationWorkflow
 from src.workflows.shopping_workflow import ShoppingWorkflow
 from src.workflows.conversation_workflow import ConversationWorkflow
@@ -25,36 +37,102 @@ from src.workflows.conversation_workflow import ConversationWorkflow
 
 load_dotenv()
 
-app = FastAPI()
-app.mount("/logs", StaticFiles(directory="logs"), name="logs")
 
+async def startup(app: FastAPI) -> None:
+    # All boot-time file I/O (log dir/handlers, YAML parsing) runs in threads so the loop
+    # stays free while uvicorn is booting
+    await asyncio.to_thread(setup_logging)
+    logging.getLogger(__name__).info("Booting Shopping Agent API...")
+    # Parse store configs once so request handlers only do a dict lookup
+    app.state.config, store_cfgs = await asyncio.gather(
+        asyncio.to_thread(ConfigLoader.load_global_config),
+        asyncio.to_thread(ConfigLoader.load_all_store_configs),
+    )
+    app.state.store_cfgs = MappingProxyType(store_cfgs)
+    # One long-lived Temporal client per worker; if the server is not reachable yet the
+    # API still boots and the first v2 request connects instead
+    app.state.temporal = None
+    try:
+        app.state.temporal = await get_temporal_client()
+    except Exception:
+        logging.getLogger(__name__).warning("Temporal not reachable at startup; connecting lazily", exc_info=True)
 
-@app.get("/health")
-async def health() -> JSONResponse:
-    return JSONResponse({"status": "healthy"})
 
+async def shutdown(app: FastAPI) -> None:
+    logging.getLogger(__name__).info("Shutting down Shopping Agent API...")
+    await qr_watcher.stop()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Runs inside uvicorn's loop, so anything created here lives as long as the server
+    await startup(app)
+    try:
+        yield
+    finally:
+        await shutdown(app)
+
+
+# Interactive docs and the OpenAPI schema are a development aid; set ENABLE_API_DOCS=1 to serve them
+_DOCS_ENABLED = os.getenv("ENABLE_API_DOCS", "").lower() in {"1", "true", "yes"}
+
+app = FastAPI(
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+    docs_url="/docs" if _DOCS_ENABLED else None,
+    redoc_url="/redoc" if _DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if _DOCS_ENABLED else None,
+)
+app.mount("/logs", CachedStaticFiles(directory="logs"), name="logs")
+
+
+# Probes hit this constantly; a plain Response holds no per-request state, so one
+# instance can be sent again and again without re-encoding the body or headers
+_HEALTH_RESPONSE = Response(content=b'{"status":"healthy"}', media_type="application/json")
+
+
+@app.get("/health", response_model=None)
+async def health() -> Response:
+    return _HEALTH_RESPONSE
+
+
+_temporal_connect_lock = asyncio.Lock()
 
-async def startup() -> None:
-    setup_logging()
-    logging.getLogger(__name__).info("Booting Shopping Agent API...")
-    _ = ConfigLoader.load_global_config()
+
+async def _temporal_client() -> Client:
+    client = app.state.temporal
+    if client is not None:
+        return client
+    async with _temporal_connect_lock:
+        if app.state.temporal is None:
+            app.state.temporal = await get_temporal_client()
+        return app.state.temporal
+
+
+def _require_store(store: str) -> None:
+    if store not in app.state.store_cfgs:
+        raise HTTPException(status_code=404, detail=f"Unknown store: {store}")
 
 
 class AgentInput(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     run_id: str
     kind: str
     value: str
 
 
-@app.post("/agent/input")
-async def submit_agent_input(payload: AgentInput) -> JSONResponse:
+@app.post("/agent/input", response_model=None)
+async def submit_agent_input(payload: AgentInput) -> ORJSONResponse:
     ok = human_broker.submit_input(payload.run_id, payload.kind, payload.value)
     if not ok:
         raise HTTPException(status_code=404, detail="No pending input for this run_id/kind")
-    return JSONResponse({"status": "accepted"}, status_code=202)
+    return ORJSONResponse({"status": "accepted"}, status_code=202)
 
 
 class RunRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     goal: str
     store: str = "coop_se"
     headless: bool = True
@@ -68,71 +146,265 @@ class RunRequest(BaseModel):
 # removed legacy /run/authentication endpoint (v1)
 
 
-@app.get("/ui/qr")
-async def ui_qr(run_id: str | None = None) -> HTMLResponse:
-    html = (
-        """
+# UI pages are rendered to bytes at import time; handlers only hand the buffer to Starlette
+_STATIC_PAGE_HEADERS = {"Cache-Control": "public, max-age=60", "Vary": "Accept-Encoding"}
+# Pages below this size are not worth a gzip header and a decompress on the client
+_GZIP_MIN_SIZE = 1024
+
+
+class _StaticPage(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+    gzip_body: bytes | None
+    gzip_headers: Dict[str, str] | None
+
+
+def _static_page(html: bytes) -> _StaticPage:
+    """Pre-compute a page's gzip body and ETags once at import time."""
+    etag = f'"{hashlib.sha1(html).hexdigest()}"'
+    headers = {**_STATIC_PAGE_HEADERS, "ETag": etag}
+    if len(html) < _GZIP_MIN_SIZE:
+        return _StaticPage(html, headers, None, None)
+    # Each encoding is its own representation, so it gets its own strong ETag
+    gzip_headers = {**_STATIC_PAGE_HEADERS, "ETag": f'{etag[:-1]}-gz"', "Content-Encoding": "gzip"}
+    return _StaticPage(html, headers, gzip.compress(html, compresslevel=9, mtime=0), gzip_headers)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True if an Accept-Encoding value allows gzip with a non-zero q; an explicit gzip entry wins over '*'."""
+    wildcard_q: float | None = None
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        coding = coding.lower()
+        if coding in {"gzip", "x-gzip"}:
+            return q > 0
+        if coding == "*":
+            wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check: '*' or any listed tag equal under weak comparison (RFC 9110 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _page_response(request: Request, page: _StaticPage) -> Response:
+    # Both variants' headers carry Vary: Accept-Encoding (from _STATIC_PAGE_HEADERS), 304s included
+    body, headers = page.body, page.headers
+    if page.gzip_body is not None and _accepts_gzip(request.headers.get("accept-encoding", "")):
+        body, headers = page.gzip_body, page.gzip_headers
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+# run_id is echoed into HTML attributes; one str.translate pass escapes every character
+# that could break out of one
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"})
+
+
+def _split_page(html: str, slot: str = "$run_id") -> tuple[bytes, bytes]:
+    """Encode a page once and split it around its single run_id slot."""
+    prefix, suffix = html.encode("utf-8").split(slot.encode("utf-8"))
+    return prefix, suffix
+
+
+_QR_HTML_BYTES = b"""
         <html>
-          <head><meta http-equiv="refresh" content="3"></head>
           <body>
             <h3>BankID QR</h3>
-            <p>Refreshes every 3s. If empty, the agent hasn't produced a QR yet.</p>
-            <img src="/logs/bankid_qr.png" alt="QR" style="max-width:480px;"/>
+            <p>Updates as soon as the agent captures a new QR. If empty, the agent hasn't produced one yet.</p>
+            <img id="qr" src="/logs/bankid_qr.png" alt="QR" style="max-width:480px;"/>
+            <script>
+              const utf8 = new TextDecoder();
+              function connect() {
+                const proto = (location.protocol === 'https:') ? 'wss' : 'ws';
+                const ws = new WebSocket(`${proto}://${location.host}/ws/agent-events`);
+                ws.binaryType = 'arraybuffer';  // frames are UTF-8 JSON bytes
+                ws.onclose = () => setTimeout(connect, 1500);
+                ws.onmessage = (e) => {
+                  try {
+                    for (const evt of JSON.parse(utf8.decode(e.data))) {
+                      if (evt && evt.type === 'bankid_qr_updated') {
+                        document.getElementById('qr').src = evt.url || ('/logs/bankid_qr.png?ts=' + Date.now());
+                      }
+                    }
+                  } catch { /* ignore */ }
+                };
+              }
+              connect();
+            </script>
           </body>
         </html>
         """
-    )
-    return HTMLResponse(html)
 
 
-@app.get("/ui/qr/auto")
-async def ui_qr_auto(run_id: str | None = None) -> HTMLResponse:
-    # Simple watcher page that opens the QR tab once the file appears
-    target = f"/ui/qr?run_id={run_id or ''}"
-    html = f"""
+_QR_PAGE = _static_page(_QR_HTML_BYTES)
+
+
+@app.get("/ui/qr", response_model=None)
+async def ui_qr(request: Request, run_id: str | None = None) -> Response:
+    return _page_response(request, _QR_PAGE)
+
+
+QR_PATH = Path("logs/bankid_qr.png")
+
+
+class QrWatcher:
+    """Single filesystem watcher for the BankID QR, shared by every /ui/qr/events client."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._available = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def _watch(self) -> None:
+        if self._path.exists():
+            self._available.set()
+        async for _ in awatch(self._path.parent, watch_filter=lambda _change, p: Path(p).name == self._path.name):
+            if self._path.exists():
+                self._available.set()
+            else:
+                self._available.clear()
+
+    async def wait_available(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch())
+        await self._available.wait()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+
+qr_watcher = QrWatcher(QR_PATH)
+
+
+@app.get("/ui/qr/events", response_model=None)
+async def ui_qr_events() -> StreamingResponse:
+    async def stream() -> AsyncIterator[bytes]:
+        await qr_watcher.wait_available()
+        yield b"data: available\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+# Simple watcher page that opens the QR tab once the file appears (pushed over SSE)
+_QR_AUTO_PRE, _QR_AUTO_POST = _split_page(
+    """
     <html>
       <body>
         <h3>Waiting for BankID request…</h3>
         <p>This page will open the QR in a new tab when available.</p>
         <script>
           let opened = false;
-          async function check() {{
-            try {{
-              const res = await fetch('/logs/bankid_qr.png?ts=' + Date.now(), {{ method: 'HEAD', cache: 'no-store' }});
-              if (res.ok && !opened) {{
-                opened = true;
-                window.open('{target}', '_blank');
-              }}
-            }} catch (e) {{}}
-          }}
-          setInterval(check, 2000);
-          check();
+          const events = new EventSource('/ui/qr/events');
+          events.onmessage = () => {
+            events.close();
+            if (!opened) {
+              opened = true;
+              window.open('/ui/qr?run_id=$run_id', '_blank');
+            }
+          };
         </script>
       </body>
     </html>
     """
-    return HTMLResponse(html)
+)
+
+
+@app.get("/ui/qr/auto", response_model=None)
+async def ui_qr_auto(run_id: str | None = None) -> Response:
+    # The slot is a query value inside a JS string inside HTML: percent-encode for the URL
+    # (which also leaves no quote or backslash for the JS literal), then HTML-escape
+    safe_id = quote(run_id or "", safe="").translate(_HTML_ESCAPE_TABLE).encode("utf-8")
+    return Response(content=_QR_AUTO_PRE + safe_id + _QR_AUTO_POST, media_type="text/html")
+
+
+# Upper bounds on what is merged into one frame; clients always receive a JSON array
+_WS_BATCH_MAX = 64
+_WS_BATCH_MAX_BYTES = 32 * 1024
+# A lone event waits this long for company before it is sent by itself
+_WS_BATCH_LINGER = 0.001
+# Per-connection backlog; a client this far behind starts losing its oldest events
+_WS_QUEUE_MAX = 256
 
 
 @app.websocket("/ws/agent-events")
 async def ws_agent_events(ws: WebSocket) -> None:
     await ws.accept()
-    try:
+    queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=_WS_QUEUE_MAX)
+    dropped = 0
+
+    async def pump() -> None:
+        nonlocal dropped
         async for evt in subscribe_events():
-            await ws.send_json(evt)
-    except WebSocketDisconnect:
-        return
-    except Exception:
+            if queue.full():
+                queue.get_nowait()  # slow client: drop the oldest event rather than stall Redis reads
+                dropped += 1
+            queue.put_nowait(evt)
+
+    async def drain() -> None:
+        nonlocal dropped
+        # Whatever piled up while the previous send was in flight goes out as one frame.
+        # Events are encoded one by one so the byte cap can be enforced without re-encoding.
+        while True:
+            evt = await queue.get()
+            if queue.empty():
+                await asyncio.sleep(_WS_BATCH_LINGER)
+            parts: list[bytes | None] = []
+            size = 0
+            observe_at = -1
+            while True:
+                part = orjson.dumps(evt)
+                if evt.get("type") == "auto_observe":
+                    # Each auto_observe is a full page snapshot: only the newest one matters
+                    if observe_at >= 0:
+                        size -= len(parts[observe_at] or b"")
+                        parts[observe_at] = None
+                    observe_at = len(parts)
+                parts.append(part)
+                size += len(part)
+                if len(parts) >= _WS_BATCH_MAX or size >= _WS_BATCH_MAX_BYTES or queue.empty():
+                    break
+                evt = queue.get_nowait()
+            if dropped:
+                parts.insert(0, orjson.dumps({"type": "dropped", "count": dropped}))
+                dropped = 0
+            # Binary frame: the encoded bytes go to the socket as-is, no str round-trip
+            await ws.send_bytes(b"[" + b",".join(part for part in parts if part is not None) + b"]")
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(pump())
+            tg.create_task(drain())
+    except* WebSocketDisconnect:
+        pass
+    except* Exception:
         try:
             await ws.close()
         except Exception:
             pass
 
 
-@app.get("/ui/live")
-async def ui_live() -> HTMLResponse:
-    html = (
-        """
+_UI_LIVE_HTML = """
         <html>
           <head>
             <meta charset=\"utf-8\" />
@@ -162,7 +434,26 @@ async def ui_live() -> HTMLResponse:
             <script>
               const logPane = document.getElementById('logPane');
               const statusEl = document.getElementById('status');
+              let deltaPre = null;  // <pre> of the newest block while assistant text streams in
               function addEvent(evt) {
+                if (evt.type === 'assistant_delta') {
+                  // Merge streamed text into one block instead of one JSON dump per chunk
+                  if (deltaPre && deltaPre.isConnected && logPane.firstChild === deltaPre.parentNode) {
+                    deltaPre.textContent += evt.text || '';
+                    return;
+                  }
+                  const div = document.createElement('div');
+                  div.className = 'event';
+                  const meta = document.createElement('div');
+                  meta.className = 'meta';
+                  meta.textContent = `[${new Date().toLocaleTimeString()}] assistant`;
+                  deltaPre = document.createElement('pre');
+                  deltaPre.textContent = evt.text || '';
+                  div.appendChild(meta);
+                  div.appendChild(deltaPre);
+                  logPane.prepend(div);
+                  return;
+                }
                 const div = document.createElement('div');
                 div.className = 'event';
                 const meta = document.createElement('div');
@@ -175,29 +466,34 @@ async def ui_live() -> HTMLResponse:
                 logPane.prepend(div);
               }
               function clearLogs(){ logPane.innerHTML=''; }
+              const utf8 = new TextDecoder();
               function connect() {
                 const proto = (location.protocol === 'https:') ? 'wss' : 'ws';
                 const ws = new WebSocket(`${proto}://${location.host}/ws/agent-events`);
+                ws.binaryType = 'arraybuffer';  // frames are UTF-8 JSON bytes
                 ws.onopen = () => { statusEl.textContent = 'Connected'; statusEl.style.color = '#0a0'; };
                 ws.onclose = () => { statusEl.textContent = 'Disconnected'; statusEl.style.color = '#a00'; setTimeout(connect, 1500); };
                 ws.onerror = () => { statusEl.textContent = 'Error'; statusEl.style.color = '#a00'; };
                 ws.onmessage = (e) => {
-                  try { addEvent(JSON.parse(e.data)); } catch { /* ignore */ }
+                  try { for (const evt of JSON.parse(utf8.decode(e.data))) addEvent(evt); } catch { /* ignore */ }
                 };
               }
               connect();
             </script>
           </body>
         </html>
-        """
-    )
-    return HTMLResponse(html)
+        """.encode("utf-8")
 
 
-@app.get("/ui/desktop")
-async def ui_desktop() -> HTMLResponse:
-    html = (
-        """
+_UI_LIVE_PAGE = _static_page(_UI_LIVE_HTML)
+
+
+@app.get("/ui/live", response_model=None)
+async def ui_live(request: Request) -> Response:
+    return _page_response(request, _UI_LIVE_PAGE)
+
+
+_UI_DESKTOP_HTML = """
         <html>
           <head>
             <meta charset=\"utf-8\" />
@@ -215,17 +511,20 @@ async def ui_desktop() -> HTMLResponse:
             <iframe src="viceshttp://localhost:6080/vnc_auto.html?autoconnect=true"></iframe>
           </body>
         </html>
-        """
-    )
-    return HTMLResponse(html)
+        """.encode("utf-8")
 
 
+_UI_DESKTOP_PAGE = _static_page(_UI_DESKTOP_HTML)
 
 
-@app.get("/ui/start")
-async def ui_start() -> HTMLResponse:
-    html = (
-        """
+@app.get("/ui/desktop", response_model=None)
+async def ui_desktop(request: Request) -> Response:
+    return _page_response(request, _UI_DESKTOP_PAGE)
+
+
+
+
+_UI_START_HTML = """
         <html>
           <head>
             <meta charset=\"utf-8\" />
@@ -358,12 +657,18 @@ async def ui_start() -> HTMLResponse:
                   if (evt.type === 'awaiting_human') {
                     return null; // handled separately
                   }
+                  if (evt.type === 'assistant_delta') {
+                    return null; // token stream; the chat shows tool steps, not partial text
+                  }
                   if (evt.type === 'human_input') {
                     return `Human input received: ${evt.value}`;
                   }
                   if (evt.type === 'human_input_failed') {
                     return `Human input failed: ${evt.error}`;
                   }
+                  if (evt.type === 'workflow_start_failed') {
+                    return `Could not start ${evt.workflow_id}: ${evt.error}`;
+                  }
                   return JSON.stringify(evt);
                 } catch { return '[event]'; }
               }
@@ -427,32 +732,37 @@ async def ui_start() -> HTMLResponse:
                 inputField.focus();
               }
 
+              const utf8 = new TextDecoder();
               function connectEvents(){
                 const proto = (location.protocol === 'https:') ? 'wss' : 'ws';
                 const ws = new WebSocket(proto + '://' + location.host + '/ws/agent-events');
+                ws.binaryType = 'arraybuffer';  // frames are UTF-8 JSON bytes
                 ws.onopen = () => { statusEl.textContent = 'Running'; };
                 ws.onclose = () => { statusEl.textContent = 'Stopped'; setTimeout(connectEvents, 1500); };
                 ws.onmessage = (e) => {
                   try {
-                    const evt = JSON.parse(e.data);
-                    if (!evt) return;
-                    
-                    // Handle awaiting_human specially
-                    if (evt.type === 'awaiting_human') {
-                      addMsg('Agent is waiting for your input...', 'assistant');
-                      showHumanInputForm(evt.run_id, evt.kind, evt.prompt);
-                      return;
-                    }
-                    
-                    const txt = mapEventToAssistantText(evt);
-                    if (txt) addMsg(txt, 'assistant');
-                    if (evt.type === 'tool_result' && evt.tool === 'finalize' && evt.result && evt.result.status){
-                      addMsg('Done: ' + evt.result.status, 'assistant');
-                    }
+                    for (const evt of JSON.parse(utf8.decode(e.data))) handleEvent(evt);
                   } catch {}
                 };
               }
 
+              function handleEvent(evt){
+                if (!evt) return;
+
+                // Handle awaiting_human specially
+                if (evt.type === 'awaiting_human') {
+                  addMsg('Agent is waiting for your input...', 'assistant');
+                  showHumanInputForm(evt.run_id, evt.kind, evt.prompt);
+                  return;
+                }
+
+                const txt = mapEventToAssistantText(evt);
+                if (txt) addMsg(txt, 'assistant');
+                if (evt.type === 'tool_result' && evt.tool === 'finalize' && evt.result && evt.result.status){
+                  addMsg('Done: ' + evt.result.status, 'assistant');
+                }
+              }
+
               async function startShopping(shoppingList){
                 addMsg('You: /shop ' + shoppingList, 'user');
                 try {
@@ -583,20 +893,25 @@ async def ui_start() -> HTMLResponse:
             </script>
           </body>
         </html>
-        """
-    )
-    return HTMLResponse(html)
+        """.encode("utf-8")
+
+
+_UI_START_PAGE = _static_page(_UI_START_HTML)
+
+
+@app.get("/ui/start", response_model=None)
+async def ui_start(request: Request) -> Response:
+    return _page_response(request, _UI_START_PAGE)
 
 
-@app.get("/ui/login/email")
-async def ui_login_email(run_id: str) -> HTMLResponse:
-    html = f"""
+_LOGIN_EMAIL_PRE, _LOGIN_EMAIL_POST = _split_page(
+    """
     <html>
       <body>
         <h3>Email login</h3>
         <p>When ready, click Continue. The agent will proceed using your saved credentials.</p>
         <form method="post" action="/agent/input">
-          <input type="hidden" name="run_id" value="{run_id}">
+          <input type="hidden" name="run_id" value="$run_id">
           <input type="hidden" name="kind" value="email_continue">
           <input type="hidden" name="value" value="OK">
           <button type="submit">Continue</button>
@@ -604,13 +919,36 @@ async def ui_login_email(run_id: str) -> HTMLResponse:
       </body>
     </html>
     """
-    return HTMLResponse(html)
+)
+
+
+@app.get("/ui/login/email", response_model=None)
+async def ui_login_email(run_id: str) -> Response:
+    safe_id = run_id.translate(_HTML_ESCAPE_TABLE).encode("utf-8")
+    return Response(content=_LOGIN_EMAIL_PRE + safe_id + _LOGIN_EMAIL_POST, media_type="text/html")
 
 
 # removed legacy /run/shopping endpoint (v1)
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+async def _parse_body(request: Request, model: type[ModelT]) -> ModelT:
+    # Validate the raw body in pydantic-core in one pass rather than json.loads() into a
+    # dict and validating that; errors still surface as FastAPI's usual 422 payload
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as exc:
+        # FastAPI's native body errors are located under "body"; clients key on that
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        ) from exc
+
+
 class V2RunRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     store: str = "coop_se"
     headless: bool = True
     debug: bool = False
@@ -620,40 +958,50 @@ class V2RunRequest(BaseModel):
     shopping_list: str | None = None
 
 
-@app.post("/v2/run/authentication")
-async def v2_run_authentication(req: V2RunRequest) -> JSONResponse:
-    try:
-        client = await get_temporal_client()
-        payload = req.model_dump()
-        workflow_id = req.workflow_id or f"auth-{uuid.uuid4()}"
-        payload["workflow_id"] = workflow_id
-        handle = await client.start_workflow(
-            AuthenticationWorkflow.run,
-            payload,
-            id=workflow_id,
-            task_queue=req.task_queue,
-        )
-        return JSONResponse({"workflow_id": handle.id})
-    except Exception as exc:
-        return JSONResponse({"error": str(exc)}, status_code=500)
+# Strong references to in-flight background starts so they are not garbage-collected
+_background_starts: set[asyncio.Task[None]] = set()
 
 
-@app.post("/v2/run/shopping")
-async def v2_run_shopping(req: V2RunRequest) -> JSONResponse:
-    try:
-        client = await get_temporal_client()
-        payload = req.model_dump()
-        workflow_id = req.workflow_id or f"shop-{uuid.uuid4()}"
-        payload["workflow_id"] = workflow_id
-        handle = await client.start_workflow(
-            ShoppingWorkflow.run,
-            payload,
-            id=workflow_id,
-            task_queue=req.task_queue,
-        )
-        return JSONResponse({"workflow_id": handle.id})
-    except Exception as exc:
-        return JSONResponse({"error": str(exc)}, status_code=500)
+def _start_workflow_in_background(workflow: Any, payload: Dict[str, Any], *, workflow_id: str, task_queue: str) -> None:
+    """Start a workflow without holding the HTTP response on the Temporal round-trip.
+
+    The id is generated locally, so the caller can answer straight away; a failed start
+    is reported as a workflow_start_failed event on /ws/agent-events.
+    """
+
+    async def start() -> None:
+        try:
+            client = await _temporal_client()
+            await client.start_workflow(workflow, payload, id=workflow_id, task_queue=task_queue)
+        except Exception as exc:
+            logging.getLogger(__name__).warning("Failed to start workflow %s", workflow_id, exc_info=True)
+            await publish_event({"type": "workflow_start_failed", "workflow_id": workflow_id, "error": str(exc)})
+
+    task = asyncio.create_task(start())
+    _background_starts.add(task)
+    task.add_done_callback(_background_starts.discard)
+
+
+@app.post("/v2/run/authentication", response_model=None)
+async def v2_run_authentication(request: Request) -> ORJSONResponse:
+    req = await _parse_body(request, V2RunRequest)
+    _require_store(req.store)
+    payload = req.__dict__.copy()  # flat model: a shallow copy is all model_dump() would do
+    workflow_id = req.workflow_id or f"auth-{secrets.token_hex(8)}"
+    payload["workflow_id"] = workflow_id
+    _start_workflow_in_background(AuthenticationWorkflow.run, payload, workflow_id=workflow_id, task_queue=req.task_queue)
+    return ORJSONResponse({"workflow_id": workflow_id}, status_code=202)
+
+
+@app.post("/v2/run/shopping", response_model=None)
+async def v2_run_shopping(request: Request) -> ORJSONResponse:
+    req = await _parse_body(request, V2RunRequest)
+    _require_store(req.store)
+    payload = req.__dict__.copy()
+    workflow_id = req.workflow_id or f"shop-{secrets.token_hex(8)}"
+    payload["workflow_id"] = workflow_id
+    _start_workflow_in_background(ShoppingWorkflow.run, payload, workflow_id=workflow_id, task_queue=req.task_queue)
+    return ORJSONResponse({"workflow_id": workflow_id}, status_code=202)
 
 
 class ConversationRequest(BaseModel):
@@ -662,14 +1010,14 @@ class ConversationRequest(BaseModel):
     task_queue: str = "shopping-agent-task-queue"
 
 
-@app.post("/v2/conversation")
-async def v2_conversation(req: ConversationRequest) -> JSONResponse:
+@app.post("/v2/conversation", response_model=None)
+async def v2_conversation(req: ConversationRequest) -> ORJSONResponse:
     """
     Conversational endpoint - natural language shopping assistant
     """
     try:
-        client = await get_temporal_client()
-        workflow_id = req.workflow_id or f"conv-{uuid.uuid4()}"
+        client = await _temporal_client()
+        workflow_id = req.workflow_id or f"conv-{secrets.token_hex(8)}"
         
         payload = {
             "user_message": req.message,
@@ -687,56 +1035,99 @@ async def v2_conversation(req: ConversationRequest) -> JSONResponse:
         
         result = await handle.result()
         
-        return JSONResponse({
+        return ORJSONResponse({
             "message": result["message"],
             "workflow_id": handle.id,
             "session_context": result["session_context"],
             "next_action": result["next_action"]
         })
     except Exception as exc:
-        return JSONResponse({"error": str(exc)}, status_code=500)
+        return ORJSONResponse({"error": str(exc)}, status_code=500)
 
 
 class SignalRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     workflow_id: str
 
 
-@app.post("/v2/signal/pause")
-async def signal_pause(req: SignalRequest) -> JSONResponse:
+@app.post("/v2/signal/pause", response_model=None)
+async def signal_pause(request: Request) -> ORJSONResponse:
+    req = await _parse_body(request, SignalRequest)
     try:
-        client = await get_temporal_client()
+        client = await _temporal_client()
         handle = client.get_workflow_handle(req.workflow_id)
         await handle.signal(ShoppingWorkflow.pause)
-        return JSONResponse({"ok": True})
+        return ORJSONResponse({"ok": True})
     except Exception as exc:
-        return JSONResponse({"error": str(exc)}, status_code=500)
+        return ORJSONResponse({"error": str(exc)}, status_code=500)
 
 
-@app.post("/v2/signal/resume")
-async def signal_resume(req: SignalRequest) -> JSONResponse:
+@app.post("/v2/signal/resume", response_model=None)
+async def signal_resume(request: Request) -> ORJSONResponse:
+    req = await _parse_body(request, SignalRequest)
     try:
-        client = await get_temporal_client()
+        client = await _temporal_client()
         handle = client.get_workflow_handle(req.workflow_id)
         await handle.signal(ShoppingWorkflow.resume)
-        return JSONResponse({"ok": True})
+        return ORJSONResponse({"ok": True})
     except Exception as exc:
-        return JSONResponse({"error": str(exc)}, status_code=500)
+        return ORJSONResponse({"error": str(exc)}, status_code=500)
 
 
-@app.post("/v2/signal/cancel")
-async def signal_cancel(req: SignalRequest) -> JSONResponse:
+@app.post("/v2/signal/cancel", response_model=None)
+async def signal_cancel(request: Request) -> ORJSONResponse:
+    req = await _parse_body(request, SignalRequest)
     try:
-        client = await get_temporal_client()
+        client = await _temporal_client()
         handle = client.get_workflow_handle(req.workflow_id)
         await handle.signal(ShoppingWorkflow.cancel)
-        return JSONResponse({"ok": True})
+        return ORJSONResponse({"ok": True})
     except Exception as exc:
-        return JSONResponse({"error": str(exc)}, status_code=500)
+        return ORJSONResponse({"error": str(exc)}, status_code=500)
+
+
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(_HEALTH_BODY)).encode())],
+}
+_HEALTH_BODY_MESSAGE = {"type": "http.response.body", "body": _HEALTH_BODY}
+
+
+async def server_app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+    """ASGI entrypoint for uvicorn: answers GET /health before FastAPI routing, everything else goes to app."""
+    if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+        await send(_HEALTH_START)
+        await send(_HEALTH_BODY_MESSAGE)
+        return
+    await app(scope, receive, send)
 
 
 def run() -> None:
-    asyncio.run(startup())
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_config=None)
+    # uvloop/httptools ship with uvicorn[standard]; startup runs via the lifespan on the same loop.
+    # Workers fork from the import string, each with its own app.state and event loop; the
+    # handlers never block, so one worker per core saturates the CPU. Every worker holds its
+    # own caches, Temporal client and Redis subscription (events fan out to all of them),
+    # so tune WEB_CONCURRENCY down on memory-constrained hosts.
+    # Under debugpy (the dev image) stay in one process: spawned workers are not attached,
+    # so breakpoints in handlers would never hit
+    default_workers = 1 if "debugpy" in sys.modules else (os.cpu_count() or 1)
+    workers = int(os.getenv("WEB_CONCURRENCY", str(default_workers)))
+    uvicorn.run(
+        "main:server_app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=False,  # frames are small batched JSON; deflate costs more CPU than it saves
+        log_config=None,
+        access_log=False,  # one log line per request (and per /health probe) is pure overhead
+        log_level="warning",
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Fail if any FastAPI route in main.py, or a generator handed to StreamingResponse, is sync.
+
+Starlette runs sync handlers and sync iterators in its thread pool, which is an
+order of magnitude slower for streaming responses. Run via `make check-async`.
+"""
+import ast
+import sys
+from pathlib import Path
+
+ROUTE_METHODS = {"get", "post", "put", "patch", "delete", "head", "options", "websocket", "api_route"}
+
+
+def _is_route(decorator: ast.expr) -> bool:
+    func = decorator.func if isinstance(decorator, ast.Call) else decorator
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr in ROUTE_METHODS
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "app"
+    )
+
+
+def check(path: Path) -> list[str]:
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    sync_funcs = {node.name: node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)}
+    problems = []
+    for node in sync_funcs.values():
+        if any(_is_route(d) for d in node.decorator_list):
+            problems.append(f"{path}:{node.lineno}: route handler {node.name}() is not async")
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "StreamingResponse"):
+            continue
+        if node.args and isinstance(node.args[0], ast.Call) and isinstance(node.args[0].func, ast.Name):
+            name = node.args[0].func.id
+            if name in sync_funcs:
+                problems.append(f"{path}:{node.lineno}: StreamingResponse gets sync generator {name}()")
+    return problems
+
+
+def main() -> int:
+    problems = check(Path(sys.argv[1] if len(sys.argv) > 1 else "main.py"))
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
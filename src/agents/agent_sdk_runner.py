@@ -1,18 +1,148 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from openai import AsyncOpenAI
+import orjson
 
+from src.agents.prompt_cache import load_prompt
 from src.agents.sdk_tools import build_openai_tools, execute_tool
 from src.agents.tools import ToolEnv
 from src.utils.config_loader import ConfigLoader
-from src.core.events import publish_event
+from src.core.events import flush_events, publish_event_nowait
+from src.core.openai_client import get_openai_client
 from src.core.memory_store import retrieve_known_resolution, record_experience
 
 
+# Reads the cookie overlay and the first visible dialog in a single CDP round-trip.
+# "Visible" follows Playwright: a non-empty box and not visibility:hidden.
+_SNAPSHOT_JS = """
+() => {
+  const visible = (el) => {
+    if (!el) return false;
+    if (getComputedStyle(el).visibility === 'hidden') return false;
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0;
+  };
+  const firstVisible = (sel) => Array.from(document.querySelectorAll(sel)).find(visible) || null;
+  const overlay = visible(document.querySelector('#cmpwrapper'));
+  const dialog = firstVisible("[role='dialog'], dialog[open]") || firstVisible("[aria-modal='true']");
+  if (!dialog) return { overlay, modal_present: false, modal_title: null, modal_text: null };
+  const heading = dialog.querySelector("[role='heading'], h1, h2, h3, h4, h5, h6");
+  const text = (dialog.textContent || '').trim().slice(0, 300);
+  return {
+    overlay,
+    modal_present: true,
+    modal_title: (heading && heading.textContent.slice(0, 300)) || null,
+    modal_text: text || null,
+  };
+}
+"""
+
+# Tools that only read page or config state. Consecutive calls to these in one assistant
+# turn run concurrently; every other tool (navigation, input, finalize, ...) is a barrier.
+_READ_ONLY_TOOLS = frozenset({
+    "exists",
+    "count",
+    "query_text",
+    "current_url",
+    "exists_text",
+    "check_logged_in",
+    "modal_exists",
+    "get_config",
+    "get_secret",
+})
+
+
+def _group_tool_calls(tool_calls: List[Any]) -> List[List[Any]]:
+    groups: List[List[Any]] = []
+    for tc in tool_calls:
+        if groups and tc.function.name in _READ_ONLY_TOOLS and groups[-1][-1].function.name in _READ_ONLY_TOOLS:
+            groups[-1].append(tc)
+        else:
+            groups.append([tc])
+    return groups
+
+
+@lru_cache(maxsize=32)
+def _combined_system_prompt(system_prompt: str) -> str:
+    # Global system prompt prepended to the agent's. Built once per agent prompt so every
+    # request of every run starts with the same string, which is what OpenAI's automatic
+    # prompt caching keys on; messages[0] is never modified after this.
+    try:
+        global_system = load_prompt("global_system.txt")
+    except Exception:
+        global_system = ""
+    return (global_system + "\n\n" + system_prompt).strip()
+
+
+async def _run_tool(name: str, args: Dict[str, Any], env: ToolEnv, allowed: frozenset[str]) -> Dict[str, Any]:
+    if name not in allowed:
+        # The model only sees the allowed tools, but nothing stops it naming another one
+        return {"ok": False, "error": f"tool not allowed: {name}"}
+    try:
+        return await execute_tool(name, args, env)
+    except Exception as exc:
+        return {"ok": False, "error": str(exc)}
+
+
+# How long a known-resolution lookup (hit or miss) is reused for an identical modal signature
+_RECIPE_TTL_SECONDS = 30.0
+
+# Streamed text is sent to viewers in chunks rather than one event per token, so it
+# neither floods Redis nor crowds tool events out of the websocket's bounded queue
+_DELTA_FLUSH_SECONDS = 0.25
+_DELTA_FLUSH_CHARS = 512
+
+# Modal text keyword -> modal_kind, matched case-insensitively in one regex pass
+_MODAL_KINDS = {
+    "postnummer": "postcode",
+    "var är du": "postcode",
+    "hitta butik": "postcode",
+    "leveransadress": "postcode",
+}
+_MODAL_KIND_RE = re.compile("|".join(map(re.escape, _MODAL_KINDS)), re.IGNORECASE)
+
+# A step's closing snapshot is reused as the next step's modal probe if it is at most this old;
+# no tool runs in between, so only the page's own scripts could have changed it
+_PROBE_REUSE_SECONDS = 0.5
+
+# Host part of an absolute URL; the signature only needs the site, not a full urlparse()
+_HOST_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+\-.]*://(?:[^@/?#]*@)?([^/:?#]+)")
+
+_AUTO_OBSERVE_PREFIX = "CONTEXT_AUTO_OBSERVE: "
+_STALE_AUTO_OBSERVE = _AUTO_OBSERVE_PREFIX + "(stale snapshot)"
+
+
+def _append_auto_observe(messages: List[Dict[str, Any]], auto_obs: Dict[str, Any], last_hash: Optional[str]) -> str:
+    """Append an auto-observe context message unless it repeats the previous snapshot."""
+    # Sorted keys make the encoding canonical, so one orjson pass serves both hash and message
+    payload = orjson.dumps(auto_obs, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    digest = hashlib.blake2b(payload, digest_size=8).hexdigest()
+    if digest != last_hash:
+        messages.append({"role": "assistant", "content": _AUTO_OBSERVE_PREFIX + payload.decode()})
+    return digest
+
+
+def _stale_old_snapshots(messages: List[Dict[str, Any]]) -> None:
+    # Only the newest snapshot describes the page; older ones are stubbed so each request
+    # does not re-send every snapshot of the run as prompt tokens
+    newest_seen = False
+    for msg in reversed(messages):
+        content = msg.get("content")
+        if msg.get("role") != "assistant" or not isinstance(content, str) or not content.startswith(_AUTO_OBSERVE_PREFIX):
+            continue
+        if newest_seen and content != _STALE_AUTO_OBSERVE:
+            msg["content"] = _STALE_AUTO_OBSERVE
+        newest_seen = True
+
+
 class AgentSDKRunner:
     def __init__(self, *, model: Optional[str] = None, temperature: float = 0.0) -> None:
         cfg = ConfigLoader.load_global_config()
@@ -22,7 +152,9 @@ class AgentSDKRunner:
         timeouts = agents_cfg.get("timeouts", {})
         self._per_step_seconds = int(timeouts.get("per_step_seconds", 30))
         self._max_total_steps = int(agents_cfg.get("max_total_steps", 12))
-        self._client = AsyncOpenAI()
+        # (site, title_kws, text_kws) -> (fetched_at, recipe); misses are cached too, since the
+        # same modal tends to stay up for several steps
+        self._recipe_cache: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], Tuple[float, Any]] = {}
         self._logger = logging.getLogger(__name__)
 
     async def run(
@@ -32,36 +164,29 @@ class AgentSDKRunner:
         system_prompt: str,
         user_goal: str,
         page_env: ToolEnv,
-        allowed_tools: List[str],
+        allowed_tools: Sequence[str],
         debug: bool = False,
     ) -> Dict[str, Any]:
-        # Prepend global system prompt
-        try:
-            with open("src/agents/prompts/global_system.txt", "r", encoding="utf-8") as f:
-                global_system = f.read()
-        except Exception:
-            global_system = ""
-        system_combined = (global_system + "\n\n" + system_prompt).strip()
+        system_combined = _combined_system_prompt(system_prompt)
 
         messages: List[Dict[str, Any]] = [
             {"role": "system", "content": system_combined},
             {"role": "user", "content": user_goal},
         ]
-        tools = build_openai_tools([t for t in allowed_tools if t != "invoke_subagent"])  # safety denylist
+        offered = [t for t in allowed_tools if t != "invoke_subagent"]  # safety denylist
+        tools = build_openai_tools(offered)
+        # Checked for every tool call the model makes, so a set rather than the list
+        offered_set = frozenset(offered)
 
         steps_used = 0
         last_config_value: Any | None = None
+        last_obs_hash: Optional[str] = None
+        # (taken_at, snapshot) of the most recent auto-observe snapshot
+        last_obs: Optional[Tuple[float, Dict[str, Any]]] = None
         trace: List[Dict[str, Any]] = []
 
-        # Ensure clean page state for each run: clear history and localStorage/sessionStorage
-        try:
-            await page_env.page.context.clear_cookies()
-        except Exception:
-            pass
-        try:
-            await page_env.page.add_init_script("window.localStorage.clear(); window.sessionStorage.clear();")
-        except Exception:
-            pass
+        # No per-run cookie/storage reset: callers hand in a page from a fresh BrowserContext
+        # (see activities._prepared_env), which already starts with empty cookies and storage
 
         # simple retry accounting to nudge HITL if stuck
         consecutive_failures = 0
@@ -69,12 +194,14 @@ class AgentSDKRunner:
         while steps_used < self._max_total_steps:
             # If a modal is currently visible, surface any known resolution recipe as guidance
             try:
-                auto_probe = await self._auto_observe_snapshot(page_env)
+                if last_obs is not None and time.monotonic() - last_obs[0] < _PROBE_REUSE_SECONDS:
+                    auto_probe = last_obs[1]
+                else:
+                    auto_probe = await self._auto_observe_snapshot(page_env)
                 if auto_probe.get("modal_present"):
                     # Build a simple signature from url host and modal title/text keywords
-                    import urllib.parse
-                    parsed = urllib.parse.urlparse(auto_probe.get("url") or "")
-                    site = (parsed.hostname or "").lower()
+                    m = _HOST_RE.match(auto_probe.get("url") or "")
+                    site = m.group(1).lower() if m else ""
                     title = (auto_probe.get("modal_title") or "").lower()
                     text = (auto_probe.get("modal_text") or "").lower()
                     signature = {
@@ -82,7 +209,7 @@ class AgentSDKRunner:
                         "title_kws": [w for w in title.split()[:6]],
                         "text_kws": [w for w in text.split()[:10]],
                     }
-                    recipe = await retrieve_known_resolution("modal", signature)
+                    recipe = await self._known_resolution(signature)
                     if recipe:
                         # Provide a KNOWN_RESOLUTION hint while keeping the model in control
                         hint_steps = "; ".join([f"{step.get('tool')}({step.get('args', {})})" for step in recipe])
@@ -92,16 +219,9 @@ class AgentSDKRunner:
                         })
             except Exception:
                 pass
-            resp = await self._client.chat.completions.create(
-                model=self._model,
-                temperature=self._temperature,
-                messages=messages,
-                tools=tools,
-                tool_choice="auto",
-            )
-            choice = resp.choices[0]
-            msg = choice.message
-            tool_calls = msg.tool_calls or []
+            _stale_old_snapshots(messages)
+            msg, early_obs = await self._stream_completion(messages, tools, page_env)
+            tool_calls = msg.tool_calls
 
             # Append the assistant message we just received to preserve protocol context.
             # If there are tool_calls, they must be included on the assistant message that precedes our tool results.
@@ -125,97 +245,94 @@ class AgentSDKRunner:
                 messages.append({"role": "assistant", "content": msg.content})
 
             if not tool_calls:
-                # No tool calls; append assistant text (if any) and provide auto-observe context as assistant message
-                if msg.content:
-                    messages.append({"role": "assistant", "content": msg.content})
-                auto_obs = await self._auto_observe_snapshot(page_env)
+                # No tool calls; the assistant text was appended above, so only add auto-observe context
+                # Usually already taken while the rest of the reply was still streaming
+                auto_obs = await early_obs if early_obs is not None else await self._auto_observe_snapshot(page_env)
+                last_obs = (time.monotonic(), auto_obs)
                 # Provide lightweight context without violating tool-call protocol
-                messages.append({
-                    "role": "assistant",
-                    "content": f"CONTEXT_AUTO_OBSERVE: {json.dumps(auto_obs)}",
-                })
-                try:
-                    await publish_event({"type": "auto_observe", "data": auto_obs})
-                except Exception:
-                    pass
+                last_obs_hash = _append_auto_observe(messages, auto_obs, last_obs_hash)
+                publish_event_nowait({"type": "auto_observe", "data": auto_obs})
                 steps_used += 1
                 continue
 
-            # Execute tool calls in order
-            for tc in tool_calls:
-                name = tc.function.name
-                args = {}
-                try:
-                    args = json.loads(tc.function.arguments or "{}")
-                except Exception:
+            # Execute tool calls in model order; runs of consecutive read-only calls are
+            # dispatched together, everything else is a serial barrier
+            for group in _group_tool_calls(tool_calls):
+                prepared = []
+                for tc in group:
+                    name = tc.function.name
                     args = {}
+                    try:
+                        args = orjson.loads(tc.function.arguments or "{}")
+                    except Exception:
+                        args = {}
 
-                # Auto-substitute last config value for postcode placeholders
-                if name in {"modal_fill_label", "fill_label"}:
-                    val = args.get("value")
-                    if isinstance(val, str) and val.strip() in {"<to-be-filled>", "", "<value>"} and last_config_value not in (None, ""):
-                        args = dict(args)
-                        args["value"] = str(last_config_value)
+                    # Auto-substitute last config value for postcode placeholders
+                    if name in {"modal_fill_label", "fill_label"}:
+                        val = args.get("value")
+                        if isinstance(val, str) and val.strip() in {"<to-be-filled>", "", "<value>"} and last_config_value not in (None, ""):
+                            args = dict(args)
+                            args["value"] = str(last_config_value)
+                    prepared.append((tc, name, args))
 
-                # Execute tool safely; always produce a tool message
-                try:
-                    result = await execute_tool(name, args, page_env)
-                except Exception as exc:
-                    result = {"ok": False, "error": str(exc)}
-                # Publish step event for live viewer
-                try:
-                    await publish_event({
+                # Execute tools safely; always produce a tool message per call
+                if len(prepared) == 1:
+                    results = [await _run_tool(prepared[0][1], prepared[0][2], page_env, offered_set)]
+                else:
+                    results = await asyncio.gather(*(_run_tool(name, args, page_env, offered_set) for _, name, args in prepared))
+
+                for (tc, name, args), result in zip(prepared, results):
+                    # Step event for the live viewer; queued so the loop never waits on Redis
+                    publish_event_nowait({
                         "type": "tool_result",
                         "tool": name,
                         "args": args,
                         "result": result,
                     })
-                except Exception:
-                    pass
-                # Capture get_config value for substitution
-                if name == "get_config" and result.get("ok"):
-                    if "value" in result:
-                        last_config_value = result.get("value")
-                    elif isinstance(result.get("data"), dict) and "value" in result.get("data", {}):
-                        last_config_value = result["data"].get("value")
-
-                # Append the tool result message back
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc.id,
-                    "name": name,
-                    "content": json.dumps(result, ensure_ascii=False),
-                })
-                steps_used += 1
-                # update failure counter
-                if isinstance(result, dict) and not result.get("ok", True):
-                    consecutive_failures += 1
-                else:
-                    consecutive_failures = 0
-
-                # Keep a trace similar to the legacy runner
-                if debug:
-                    trace.append({"tool": name, "args": args, "result": result})
-
-                # Only honor termination via finalize tool
-                if name == "finalize" and result.get("ok"):
-                    out: Dict[str, Any] = {"run_id": agent_name, "terminated": True, "observations": []}
-                    out["result"] = {
-                        "status": result.get("status"),
-                        "provider": result.get("provider"),
-                        "error": result.get("error"),
-                        "screenshot": result.get("screenshot"),
-                    }
+                    # Capture get_config value for substitution
+                    if name == "get_config" and result.get("ok"):
+                        if "value" in result:
+                            last_config_value = result.get("value")
+                        elif isinstance(result.get("data"), dict) and "value" in result.get("data", {}):
+                            last_config_value = result["data"].get("value")
+
+                    # Append the tool result message back
+                    messages.append({
+                        "role": "tool",
+                        "tool_call_id": tc.id,
+                        "name": name,
+                        "content": orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode(),
+                    })
+                    steps_used += 1
+                    # update failure counter
+                    if isinstance(result, dict) and not result.get("ok", True):
+                        consecutive_failures += 1
+                    else:
+                        consecutive_failures = 0
+
+                    # Keep a trace similar to the legacy runner
                     if debug:
-                        out["trace"] = trace
-                    return out
+                        trace.append({"tool": name, "args": args, "result": result})
 
-                # Inject auto-observe context as assistant message (not a tool response)
+                    # Only honor termination via finalize tool
+                    if name == "finalize" and result.get("ok"):
+                        out: Dict[str, Any] = {"run_id": agent_name, "terminated": True, "observations": []}
+                        out["result"] = {
+                            "status": result.get("status"),
+                            "provider": result.get("provider"),
+                            "error": result.get("error"),
+                            "screenshot": result.get("screenshot"),
+                        }
+                        if debug:
+                            out["trace"] = trace
+                        await flush_events()
+                        return out
+
+                # Inject auto-observe context as assistant message (not a tool response), once per group.
+                # The queued tool_result events are published while the snapshot runs.
                 auto_obs = await self._auto_observe_snapshot(page_env)
-                messages.append({
-                    "role": "assistant",
-                    "content": f"CONTEXT_AUTO_OBSERVE: {json.dumps(auto_obs)}",
-                })
+                last_obs = (time.monotonic(), auto_obs)
+                last_obs_hash = _append_auto_observe(messages, auto_obs, last_obs_hash)
                 # If repeated failures or a modal persists, nudge the model to ask for HITL
                 try:
                     if consecutive_failures >= 2 or auto_obs.get("modal_present"):
@@ -225,82 +342,124 @@ class AgentSDKRunner:
                         })
                 except Exception:
                     pass
-                try:
-                    await publish_event({"type": "auto_observe", "data": auto_obs})
-                except Exception:
-                    pass
+                publish_event_nowait({"type": "auto_observe", "data": auto_obs})
 
         # Budget exceeded
+        await flush_events()
         out = {"run_id": agent_name, "terminated": False, "reason": "max_steps_exceeded"}
         if debug:
             out["trace"] = trace
         return out
 
+    async def _known_resolution(self, signature: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        key = (signature["site"], tuple(signature["title_kws"]), tuple(signature["text_kws"]))
+        now = time.monotonic()
+        hit = self._recipe_cache.get(key)
+        if hit is not None and now - hit[0] < _RECIPE_TTL_SECONDS:
+            return hit[1]
+        recipe = await retrieve_known_resolution("modal", signature)
+        # Opportunistic eviction keeps the cache bounded by what was seen within one TTL
+        self._recipe_cache = {k: v for k, v in self._recipe_cache.items() if now - v[0] < _RECIPE_TTL_SECONDS}
+        self._recipe_cache[key] = (now, recipe)
+        return recipe
+
+    async def _stream_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: List[Dict[str, Any]],
+        page_env: ToolEnv,
+    ) -> Tuple[SimpleNamespace, Optional[asyncio.Task[Dict[str, Any]]]]:
+        """Stream one completion, rebuilding the message the non-streaming API would return.
+
+        Content deltas are coalesced into assistant_delta events for the live viewer, flushed
+        every _DELTA_FLUSH_SECONDS or _DELTA_FLUSH_CHARS and at the end. Once text
+        starts arriving without any tool call, the auto-observe snapshot is started so it
+        overlaps the rest of the decode; it is returned as a task (None if tools were called).
+        """
+        stream = await get_openai_client().chat.completions.create(
+            model=self._model,
+            temperature=self._temperature,
+            messages=messages,
+            tools=tools,
+            tool_choice="auto",
+            stream=True,
+        )
+        content_parts: List[str] = []
+        calls: Dict[int, Dict[str, Any]] = {}
+        snapshot: Optional[asyncio.Task[Dict[str, Any]]] = None
+        # Text streamed since the last assistant_delta event
+        pending: List[str] = []
+        pending_chars = 0
+        last_flush = time.monotonic()
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                for tc_delta in delta.tool_calls or []:
+                    slot = calls.setdefault(tc_delta.index, {"id": None, "name": "", "arguments": []})
+                    if tc_delta.id:
+                        slot["id"] = tc_delta.id
+                    if tc_delta.function is not None:
+                        if tc_delta.function.name:
+                            slot["name"] += tc_delta.function.name
+                        if tc_delta.function.arguments:
+                            slot["arguments"].append(tc_delta.function.arguments)
+                if delta.content:
+                    content_parts.append(delta.content)
+                    if snapshot is None and not calls:
+                        snapshot = asyncio.create_task(self._auto_observe_snapshot(page_env))
+                    pending.append(delta.content)
+                    pending_chars += len(delta.content)
+                    now = time.monotonic()
+                    if pending_chars >= _DELTA_FLUSH_CHARS or now - last_flush >= _DELTA_FLUSH_SECONDS:
+                        publish_event_nowait({"type": "assistant_delta", "text": "".join(pending)})
+                        pending.clear()
+                        pending_chars = 0
+                        last_flush = now
+            if pending:
+                publish_event_nowait({"type": "assistant_delta", "text": "".join(pending)})
+        except BaseException:
+            if snapshot is not None:
+                snapshot.cancel()
+            raise
+        finally:
+            await stream.close()
+        if calls and snapshot is not None:
+            # Tools will change the page; the post-tool snapshot supersedes this one
+            snapshot.cancel()
+            snapshot = None
+        tool_calls = [
+            SimpleNamespace(
+                id=slot["id"],
+                function=SimpleNamespace(name=slot["name"], arguments="".join(slot["arguments"])),
+            )
+            for _, slot in sorted(calls.items())
+        ]
+        return SimpleNamespace(content="".join(content_parts) or None, tool_calls=tool_calls), snapshot
+
     async def _auto_observe_snapshot(self, env: ToolEnv) -> Dict[str, Any]:
-        # Mirror minimal auto_observe fields so the model can reason without another tool
+        # Mirror minimal auto_observe fields so the model can reason without another tool.
+        # One page.evaluate instead of a count/is_visible/text_content round-trip per field.
         try:
             url = env.page.url
         except Exception:
             url = ""
-        overlay = False
-        try:
-            loc = env.page.locator("#cmpwrapper").first
-            if await loc.count() > 0:
-                try:
-                    overlay = await loc.is_visible()
-                except Exception:
-                    overlay = False
-        except Exception:
-            overlay = False
-        modal_present = False
-        modal_title = None
-        modal_text = None
-        modal_kind = None
         try:
-            dialog = env.page.get_by_role("dialog").first
-            visible_dialog = False
-            if await dialog.count() > 0:
-                try:
-                    visible_dialog = await dialog.is_visible()
-                except Exception:
-                    visible_dialog = False
-            if not visible_dialog:
-                aria = env.page.locator("[aria-modal='true']").first
-                if await aria.count() > 0:
-                    try:
-                        if await aria.is_visible():
-                            dialog = aria
-                            visible_dialog = True
-                    except Exception:
-                        visible_dialog = False
-            if visible_dialog:
-                modal_present = True
-                try:
-                    heading = dialog.get_by_role("heading").first
-                    if await heading.count() > 0:
-                        modal_title = (await heading.text_content()) or None
-                except Exception:
-                    pass
-                try:
-                    txt = (await dialog.text_content()) or ""
-                    txt = txt.strip()
-                    if len(txt) > 300:
-                        txt = txt[:300]
-                    modal_text = txt or None
-                    low = (txt or "").lower()
-                    if any(k in low for k in ["postnummer", "var är du", "hitta butik", "leveransadress"]):
-                        modal_kind = "postcode"
-                except Exception:
-                    pass
+            snap = await env.page.evaluate(_SNAPSHOT_JS)
         except Exception:
-            pass
+            # e.g. the page is mid-navigation and the execution context is gone
+            snap = {"overlay": False, "modal_present": False, "modal_title": None, "modal_text": None}
+        m = _MODAL_KIND_RE.search(snap.get("modal_text") or "")
+        # .get: an IGNORECASE match need not lower() back to a key (e.g. "poſtnummer")
+        modal_kind = _MODAL_KINDS.get(m.group(0).lower()) if m else None
         return {
             "ok": True,
             "url": url,
-            "overlay": overlay,
-            "modal_present": modal_present,
-            "modal_title": modal_title,
-            "modal_text": modal_text,
+            "overlay": bool(snap.get("overlay")),
+            "modal_present": bool(snap.get("modal_present")),
+            "modal_title": snap.get("modal_title"),
+            "modal_text": snap.get("modal_text"),
             "modal_kind": modal_kind,
         }
 
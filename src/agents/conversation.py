@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
 import logging
+from itertools import islice
 from typing import Any, Dict, List
 
-from openai import AsyncOpenAI
+import orjson
+from src.core.openai_client import get_openai_client
 from src.utils.config_loader import ConfigLoader
 from src.core.schema_validator import SchemaValidator
+from src.agents.prompt_cache import load_prompt
 
 
 class ConversationAgent:
@@ -21,7 +23,6 @@ class ConversationAgent:
         # Use gpt-4o-mini for conversation (cheaper, faster) instead of gpt-4.1
         self._model = "gpt-4o-mini"
         self._temperature = 0.3  # Slightly creative for natural conversation
-        self._client = AsyncOpenAI()
         self._logger = logging.getLogger(__name__)
         self._validator = SchemaValidator("src/agents/schemas/conversation_response.schema.json")
     
@@ -45,8 +46,7 @@ class ConversationAgent:
             Validated JSON response matching conversation_response.schema.json
         """
         # Load system prompt
-        with open("src/agents/prompts/conversation_system.txt", "r", encoding="utf-8") as f:
-            system_prompt = f.read()
+        system_prompt = load_prompt("conversation_system.txt")
         
         # Build messages for OpenAI
         messages = self._build_messages(
@@ -77,16 +77,18 @@ class ConversationAgent:
         messages = [{"role": "system", "content": system_prompt}]
         
         # Add conversation history (last 50 messages to avoid token limits)
-        recent_history = conversation_history[-50:] if len(conversation_history) > 50 else conversation_history
-        messages.extend(recent_history)
+        messages.extend(islice(conversation_history, max(0, len(conversation_history) - 50), None))
         
         # Add current user message with context
-        context_info = f"\n\n[SESSION_CONTEXT: {json.dumps(session_context)}]" if session_context else ""
-        clarification_info = f"\n[CLARIFICATION_COUNT: {clarification_count}]" if clarification_count > 0 else ""
+        parts = [user_message]
+        if session_context:
+            parts.append(f"\n\n[SESSION_CONTEXT: {orjson.dumps(session_context).decode()}]")
+        if clarification_count > 0:
+            parts.append(f"\n[CLARIFICATION_COUNT: {clarification_count}]")
         
         messages.append({
             "role": "user",
-            "content": f"{user_message}{context_info}{clarification_info}"
+            "content": "".join(parts) if len(parts) > 1 else user_message
         })
         
         return messages
@@ -94,7 +96,7 @@ class ConversationAgent:
     async def _get_structured_response(self, messages: List[Dict]) -> Dict[str, Any]:
         """Call OpenAI with JSON mode"""
         try:
-            response = await self._client.chat.completions.create(
+            response = await get_openai_client().chat.completions.create(
                 model=self._model,
                 temperature=self._temperature,
                 messages=messages,
@@ -103,9 +105,9 @@ class ConversationAgent:
             )
             
             content = response.choices[0].message.content
-            return json.loads(content)
+            return orjson.loads(content)
         
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self._logger.error(f"Failed to parse LLM response as JSON: {e}")
             # Fallback response
             return {
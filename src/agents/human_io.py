@@ -1,37 +1,34 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Tuple
 
 from typing import Any
 
 
-@dataclass
-class PendingInput:
-    future: asyncio.Future[str]
-    kind: str
-
-
 class HumanIOBroker:
     def __init__(self) -> None:
         self._store: dict[str, Any] = {}
-        self._pending: Dict[str, PendingInput] = {}
+        # One future per (run_id, kind): a run can wait on several prompts at once and a
+        # submit is a single dict lookup with no lock, since everything runs on the loop
+        self._pending: Dict[Tuple[str, str], asyncio.Future[str]] = {}
 
     async def wait_for_input(self, run_id: str, kind: str, timeout_seconds: int = 120) -> str:
-        fut: asyncio.Future[str] = asyncio.get_event_loop().create_future()
-        self._pending[run_id] = PendingInput(future=fut, kind=kind)
+        key = (run_id, kind)
+        fut: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._pending[key] = fut
         try:
             return await asyncio.wait_for(fut, timeout=timeout_seconds)
         finally:
-            self._pending.pop(run_id, None)
+            if self._pending.get(key) is fut:
+                del self._pending[key]
 
     def submit_input(self, run_id: str, kind: str, value: str) -> bool:
-        pending = self._pending.get(run_id)
-        if not pending or pending.kind != kind:
+        fut = self._pending.pop((run_id, kind), None)
+        if fut is None:
             return False
-        if not pending.future.done():
-            pending.future.set_result(value)
+        if not fut.done():
+            fut.set_result(value)
         return True
 
 
@@ -39,5 +36,3 @@ human_broker = HumanIOBroker()
 
 
 __all__ = ["human_broker", "HumanIOBroker"]
-
-
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+
+PROMPTS_DIR = Path("src/agents/prompts")
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    """Return the text of src/agents/prompts/<name>, read from disk once per process.
+
+    Prompts only change with a deploy, so agents no longer re-read them on every run.
+    A missing file raises as before and is not cached.
+    """
+    return (PROMPTS_DIR / name).read_text(encoding="utf-8")
+
+
+__all__ = ["load_prompt"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.agents.tools import TOOL_IMPLS, ToolEnv
 
@@ -9,8 +10,13 @@ def build_openai_tools(allowed_names: Optional[List[str]] = None) -> List[Dict[s
     """Return OpenAI tool definitions for the registered tools.
 
     We start permissive (additionalProperties=True) and can tighten per-tool schemas later.
+    The list is cached per set of names and shared between runs; treat it as read-only.
     """
-    names = allowed_names or list(TOOL_IMPLS.keys())
+    return _build_openai_tools(tuple(allowed_names or TOOL_IMPLS.keys()))
+
+
+@lru_cache(maxsize=32)
+def _build_openai_tools(names: Tuple[str, ...]) -> List[Dict[str, Any]]:
     tools: List[Dict[str, Any]] = []
     for name in names:
         if name not in TOOL_IMPLS:
@@ -4,26 +4,30 @@ from dataclasses import dataclass
 from typing import Any, Dict, List
 
 from src.agents.agent_sdk_runner import AgentSDKRunner
+from src.agents.prompt_cache import load_prompt
 from src.agents.tools import ToolEnv, TOOL_IMPLS
 
 
+# Max autonomy: every registered tool minus a tiny denylist for safety. TOOL_IMPLS is fully
+# populated once src.agents.tools is imported, so the list is computed once.
+_DENIED_TOOLS = frozenset({"invoke_subagent"})
+_ALLOWED_TOOLS = tuple(sorted(k for k in TOOL_IMPLS.keys() if k not in _DENIED_TOOLS))
+
+
 class ShoppingAgent:
     def __init__(self, *, store: str) -> None:
         self._runner = AgentSDKRunner()
         self._store = store
 
     async def run(self, *, goal: str, env: ToolEnv, debug: bool = False) -> Dict[str, Any]:
-        with open("src/agents/prompts/shopping_system.txt", "r") as f:
-            system = f.read()
+        system = load_prompt("shopping_system.txt")
         # Align with current shopping prompt which uses semantic + hint tools
-        denied = {"invoke_subagent"}
-        allowed = sorted(k for k in TOOL_IMPLS.keys() if k not in denied)
         return await self._runner.run(
             agent_name="shopping",
             system_prompt=system,
             user_goal=goal,
             page_env=env,
-            allowed_tools=allowed,
+            allowed_tools=_ALLOWED_TOOLS,
             debug=debug,
         )
 
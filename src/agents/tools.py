@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import datetime
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import quote
 
 from playwright.async_api import Page
 
@@ -15,7 +17,7 @@ from src.core.web_automation import (
 )
 from src.utils.config_loader import ConfigLoader
 from src.agents.human_io import human_broker
-from src.core.events import publish_event
+from src.core.events import publish_event_nowait
 import os
 
 
@@ -55,11 +57,14 @@ async def t_count(env: ToolEnv, *, selector: str) -> Dict[str, Any]:
     return {"ok": True, "count": count}
 
 
+# textContent cut to n chars browser-side, instead of pulling the whole subtree's text
+_TEXT_HEAD_JS = "(el, n) => (el.textContent || '').slice(0, n)"
+
+
 async def t_query_text(env: ToolEnv, *, selector: str, max_len: int = 200) -> Dict[str, Any]:
     loc = env.page.locator(selector).first
-    txt = (await loc.text_content()) or ""
-    if len(txt) > max_len:
-        txt = txt[:max_len]
+    # Truncate in the page so only max_len chars cross the CDP connection
+    txt = (await loc.evaluate(_TEXT_HEAD_JS, max_len)) or ""
     return {"ok": True, "text": txt.strip()}
 
 
@@ -78,8 +83,20 @@ async def t_press(env: ToolEnv, *, selector: str, key: str) -> Dict[str, Any]:
     return {"ok": True}
 
 
+# main.py serves this directory (relative to the working directory) at this URL prefix
+_LOGS_DIR = "logs"
+_LOGS_URL_PREFIX = "/logs"
+
+
+def _logs_url(file_path: str) -> str | None:
+    """URL of a file under the /logs static mount, or None if it lives elsewhere."""
+    rel = os.path.relpath(os.path.abspath(file_path), os.path.abspath(_LOGS_DIR))
+    if rel == os.curdir or rel.split(os.sep, 1)[0] == os.pardir:
+        return None
+    return f"{_LOGS_URL_PREFIX}/{quote(rel.replace(os.sep, '/'))}"
+
+
 async def t_screenshot(env: ToolEnv, *, tag: str = "shot", path: str | None = None) -> Dict[str, Any]:
-    import datetime
     ts = datetime.datetime.now().strftime("-%Y%m%d-%H%M%S")
     file_path = path or f"logs/{tag}{ts}.png"
     # Ensure directory exists
@@ -88,6 +105,13 @@ async def t_screenshot(env: ToolEnv, *, tag: str = "shot", path: str | None = No
     except Exception:
         pass
     await env.page.screenshot(path=file_path, full_page=True)
+    if tag == "bankid_qr" or os.path.basename(file_path) == "bankid_qr.png":
+        # /ui/qr swaps its image on this event instead of reloading on a timer; the mtime
+        # query gives every QR version its own URL, so browsers can cache each one
+        url = _logs_url(file_path)
+        if url is not None:
+            url = f"{url}?v={os.stat(file_path).st_mtime_ns}"
+        publish_event_nowait({"type": "bankid_qr_updated", "run_id": env.run_id, "path": file_path, "url": url})
     return {"ok": True, "path": file_path}
 
 
@@ -194,27 +218,22 @@ async def t_request_input(env: ToolEnv, *, kind: str = "generic", prompt: str =
     if not env.run_id:
         return {"ok": False, "error": "run_id not set in environment"}
     try:
-        # Notify UI: awaiting human input
-        try:
-            await publish_event({
-                "type": "awaiting_human",
-                "run_id": env.run_id,
-                "kind": kind or "generic",
-                "prompt": prompt or "",
-            })
-        except Exception:
-            pass
+        # Notify UI: awaiting human input. Queued behind the runner's events so viewers see
+        # them in order; the drain task publishes it while we wait below
+        publish_event_nowait({
+            "type": "awaiting_human",
+            "run_id": env.run_id,
+            "kind": kind or "generic",
+            "prompt": prompt or "",
+        })
         req_kind = kind or "generic"
         value = await human_broker.wait_for_input(env.run_id, req_kind, timeout_seconds=timeout_seconds)
         # Notify UI: human input received (do not include value)
-        try:
-            await publish_event({
-                "type": "human_input",
-                "run_id": env.run_id,
-                "kind": req_kind,
-            })
-        except Exception:
-            pass
+        publish_event_nowait({
+            "type": "human_input",
+            "run_id": env.run_id,
+            "kind": req_kind,
+        })
         return {"ok": True, "value": value}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -404,6 +423,19 @@ def _get_dialog(env: ToolEnv):
     return dialog
 
 
+# Heading and body text of a dialog in one round-trip, both cut to 300 chars in the page.
+# The heading selector matches what get_by_role("heading") resolves to.
+_MODAL_TITLE_TEXT_JS = """
+(el) => {
+  const heading = el.querySelector("[role='heading'], h1, h2, h3, h4, h5, h6");
+  return {
+    title: (heading && heading.textContent.slice(0, 300)) || null,
+    text: (el.textContent || '').trim().slice(0, 300) || null,
+  };
+}
+"""
+
+
 async def t_modal_exists(env: ToolEnv) -> Dict[str, Any]:
     try:
         dlg = _get_dialog(env)
@@ -412,17 +444,8 @@ async def t_modal_exists(env: ToolEnv) -> Dict[str, Any]:
         text = None
         if present:
             try:
-                heading = dlg.get_by_role("heading").first
-                if await heading.count() > 0:
-                    title = (await heading.text_content()) or None
-            except Exception:
-                pass
-            try:
-                txt = (await dlg.text_content()) or ""
-                txt = txt.strip()
-                if len(txt) > 300:
-                    txt = txt[:300]
-                text = txt or None
+                found = await dlg.evaluate(_MODAL_TITLE_TEXT_JS)
+                title, text = found.get("title"), found.get("text")
             except Exception:
                 pass
         return {"ok": True, "present": present, "title": title, "text": text}
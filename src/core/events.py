@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import logging
 import os
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import orjson
 from redis import asyncio as aioredis
 
 
@@ -12,7 +13,15 @@ CHANNEL = os.getenv("AGENT_EVENTS_CHANNEL", "agent-events")
 REDIS_URL = os.getenv("REDIS_URL", "redis://shopping-agent-redis:6379/0")
 
 
+# Queued events waiting for the drain task; full means the viewer is far behind and new
+# events are dropped, the same best-effort contract as publish_event
+_QUEUE_MAX = 1024
+_BATCH_MAX = 64
+
+_logger = logging.getLogger(__name__)
 _redis_singleton: Optional[aioredis.Redis] = None
+_queue: Optional[asyncio.Queue[Dict[str, Any]]] = None
+_drain_task: Optional[asyncio.Task[None]] = None
 
 
 def get_redis() -> aioredis.Redis:
@@ -24,26 +33,116 @@ def get_redis() -> aioredis.Redis:
 
 async def publish_event(event: Dict[str, Any]) -> None:
     try:
-        await get_redis().publish(CHANNEL, json.dumps(event, ensure_ascii=False))
+        await get_redis().publish(CHANNEL, orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS))
     except Exception:
         # Best-effort: viewer is optional
         pass
 
 
+async def publish_events(events: List[Dict[str, Any]]) -> None:
+    """Publish events in order as one pipelined round-trip; one PUBLISH per event as before.
+
+    An event that cannot be serialized is logged and skipped; the rest still go out.
+    """
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+    except Exception:
+        return
+    queued = 0
+    for event in events:
+        try:
+            payload = orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS)
+        except Exception:
+            _logger.warning("Dropping unserializable %s event", event.get("type"), exc_info=True)
+            continue
+        pipe.publish(CHANNEL, payload)
+        queued += 1
+    if not queued:
+        return
+    try:
+        await pipe.execute()
+    except Exception:
+        # Best-effort: viewer is optional
+        pass
+
+
+def publish_event_nowait(event: Dict[str, Any]) -> None:
+    """Queue an event for publishing without waiting on Redis.
+
+    A background task drains the queue in batches via publish_events, so hot loops are
+    not gated on the viewer. Call flush_events() before returning when the tail matters.
+    """
+    global _queue, _drain_task
+    loop = asyncio.get_running_loop()
+    if _queue is None or _drain_task is None or _drain_task.done() or _drain_task.get_loop() is not loop:
+        _queue = asyncio.Queue(maxsize=_QUEUE_MAX)
+        _drain_task = loop.create_task(_drain(_queue))
+    try:
+        _queue.put_nowait(event)
+    except asyncio.QueueFull:
+        pass
+
+
+async def flush_events() -> None:
+    """Wait until every event queued by publish_event_nowait on this loop has been published."""
+    if _queue is None or _drain_task is None or _drain_task.done():
+        return
+    if _drain_task.get_loop() is not asyncio.get_running_loop():
+        return
+    await _queue.join()
+
+
+async def close_events(timeout: float = 5.0) -> None:
+    """Flush queued events (for at most `timeout` seconds), then stop the drain task.
+
+    Call once at process shutdown, on the loop that queued the events.
+    """
+    global _queue, _drain_task
+    task = _drain_task
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        return
+    try:
+        await asyncio.wait_for(flush_events(), timeout)
+    except asyncio.TimeoutError:
+        _logger.warning("Dropping %d unpublished events at shutdown", _queue.qsize() if _queue else 0)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    _queue = None
+    _drain_task = None
+
+
+async def _drain(queue: asyncio.Queue[Dict[str, Any]]) -> None:
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _BATCH_MAX:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            await publish_events(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
 async def subscribe_events() -> AsyncIterator[Dict[str, Any]]:
     pubsub = get_redis().pubsub()
     await pubsub.subscribe(CHANNEL)
     try:
-        while True:
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            if message and message.get("type") == "message":
-                try:
-                    data = json.loads(message.get("data") or "{}")
-                    yield data
-                except Exception:
-                    continue
-            else:
-                await asyncio.sleep(0.05)
+        # listen() parks on the socket until the next message arrives: no polling sleep
+        # between events and no task spawned per event
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                data = orjson.loads(message.get("data") or "{}")
+            except Exception:
+                continue
+            yield data
     finally:
         try:
             await pubsub.unsubscribe(CHANNEL)
@@ -51,6 +150,6 @@ async def subscribe_events() -> AsyncIterator[Dict[str, Any]]:
             pass
 
 
-__all__ = ["publish_event", "subscribe_events", "get_redis", "CHANNEL"]
+__all__ = ["publish_event", "publish_events", "publish_event_nowait", "flush_events", "close_events", "subscribe_events", "get_redis", "CHANNEL"]
 
 
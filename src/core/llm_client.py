@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
+import logging
 import os
 from typing import Any, Dict, Optional, Type, TypeVar
 
-from openai import AsyncOpenAI
+import orjson
 from pydantic import BaseModel
 
+from src.core.openai_client import get_openai_client
 from src.core.schema_validator import json_schema, try_validate_and_parse, load_json_schema_from_file, try_validate_with_jsonschema
 from src.utils.retry_handler import retry_async
-import logging
-import logging
 
 
 ModelT = TypeVar("ModelT", bound=BaseModel)
@@ -21,7 +20,6 @@ class LLMClient:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is not set")
-        self._client = AsyncOpenAI(api_key=api_key)
         self._model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         self._temperature = temperature
         self._max_output_tokens = max_output_tokens
@@ -30,23 +28,26 @@ class LLMClient:
     async def complete_json(self, *, system_prompt: str, user_prompt: str, response_model: Type[ModelT], max_validation_attempts: int = 2) -> ModelT:
         """Request a JSON-typed response and validate against response_model. Retries on validation failures."""
         schema_dict = json_schema(response_model)
-        self._logger.debug(
-            "LLM request %s",
-            json.dumps({
-                "model": self._model,
-                "temperature": self._temperature,
-                "system_prompt": _truncate(system_prompt),
-                "user_prompt": _truncate(user_prompt),
-            }),
-        )
+        # Guarded so the prompts are not serialized when DEBUG is off
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "LLM request %s",
+                orjson.dumps({
+                    "model": self._model,
+                    "temperature": self._temperature,
+                    "system_prompt": _truncate(system_prompt),
+                    "user_prompt": _truncate(user_prompt),
+                }).decode(),
+            )
 
         async def _op() -> ModelT:
             content = await self._chat_completion_json(system_prompt=system_prompt, user_prompt=user_prompt, schema=schema_dict)
             data = _extract_first_tool_or_text_json(content)
-            self._logger.debug(
-                "LLM raw response %s",
-                _truncate(json.dumps(content, ensure_ascii=False)),
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "LLM raw response %s",
+                    _truncate(orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS).decode()),
+                )
             model, errors = try_validate_and_parse(response_model, data)
             if model is None:
                 raise ValueError(f"Validation failed: {errors}")
@@ -65,23 +66,26 @@ class LLMClient:
 
     async def complete_json_with_schema(self, *, system_prompt: str, user_prompt: str, schema: Dict[str, Any], max_validation_attempts: int = 2) -> Dict[str, Any]:
         """Request a JSON-typed response and validate against a JSON Schema dict."""
-        self._logger.debug(
-            "LLM request %s",
-            json.dumps({
-                "model": self._model,
-                "temperature": self._temperature,
-                "system_prompt": _truncate(system_prompt),
-                "user_prompt": _truncate(user_prompt),
-            }),
-        )
+        # Guarded so the prompts are not serialized when DEBUG is off
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "LLM request %s",
+                orjson.dumps({
+                    "model": self._model,
+                    "temperature": self._temperature,
+                    "system_prompt": _truncate(system_prompt),
+                    "user_prompt": _truncate(user_prompt),
+                }).decode(),
+            )
 
         async def _op() -> Dict[str, Any]:
             content = await self._chat_completion_json(system_prompt=system_prompt, user_prompt=user_prompt, schema=schema)
             data = _extract_first_tool_or_text_json(content)
-            self._logger.debug(
-                "LLM raw response %s",
-                _truncate(json.dumps(content, ensure_ascii=False)),
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "LLM raw response %s",
+                    _truncate(orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS).decode()),
+                )
             ok, errors = try_validate_with_jsonschema(schema, data)
             if not ok:
                 raise ValueError(f"Validation failed: {errors}")
@@ -102,7 +106,7 @@ class LLMClient:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ]
-        response = await self._client.chat.completions.create(
+        response = await get_openai_client().chat.completions.create(
             model=self._model,
             temperature=self._temperature,
             messages=messages,
@@ -115,7 +119,7 @@ class LLMClient:
         if message.content is None:
             raise ValueError("Empty response content from LLM")
         try:
-            return json.loads(message.content)
+            return orjson.loads(message.content)
         except Exception as exc:  # noqa: BLE001
             raise ValueError("LLM returned non-JSON content") from exc
 
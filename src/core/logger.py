@@ -1,7 +1,14 @@
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
 from pathlib import Path
+from typing import Optional
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging() -> None:
@@ -37,5 +44,29 @@ def setup_logging() -> None:
         }
     }
     logging.config.dictConfig(config)
+    _move_handlers_off_loop()
+
+
+def _move_handlers_off_loop() -> None:
+    # The stream/file handlers above do blocking writes; run them on a QueueListener
+    # thread so a log call from a coroutine only enqueues the record
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+@atexit.register
+def _stop_listener() -> None:
+    # Flush whatever is still queued before the process exits
+    if _listener is not None:
+        _listener.stop()
 
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 import os
 import time
 from typing import Any, Dict, List, Optional
 
+import orjson
 from redis import asyncio as aioredis
 
 
@@ -46,7 +46,7 @@ async def record_experience(kind: str, signature: Dict[str, Any], recipe: List[D
         r = _get_redis()
         if MEMORY_TTL_SECONDS > 0:
             entry["ttl"] = MEMORY_TTL_SECONDS
-        await r.lpush(_key(kind, site), json.dumps(entry, ensure_ascii=False))
+        await r.lpush(_key(kind, site), orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS))
         await r.ltrim(_key(kind, site), 0, max_keep - 1)
     except Exception:
         pass
@@ -73,7 +73,7 @@ async def retrieve_known_resolution(kind: str, signature: Dict[str, Any], *, sea
         best_score = -1
         for raw in items:
             try:
-                ent = json.loads(raw)
+                ent = orjson.loads(raw)
             except Exception:
                 continue
             score = _score(signature, ent.get("signature") or {})
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Dict
+
+import httpx
+from openai import AsyncOpenAI
+
+
+# One client per event loop: httpx's connection pool is bound to the loop that first used
+# it, so a process that runs several loops (asyncio.run twice, tests, flow_test.py) must
+# not share one across them
+_clients: Dict[asyncio.AbstractEventLoop, AsyncOpenAI] = {}
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Return the AsyncOpenAI client for the running event loop.
+
+    Agents used to build one client each, and so one connection pool each, paying a fresh
+    TLS handshake per agent. Sharing one HTTP/2 pool lets concurrent agents multiplex their
+    requests over warm connections. Reads OPENAI_API_KEY like AsyncOpenAI() does.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        # Loops that have since closed can no longer use (or close) their pools
+        for stale in [other for other in _clients if other.is_closed()]:
+            del _clients[stale]
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+        client = _clients[loop] = AsyncOpenAI(http_client=http_client)
+    return client
+
+
+async def close_openai_client() -> None:
+    """Close the running loop's client, if any. Call at shutdown, before the loop closes."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+__all__ = ["get_openai_client", "close_openai_client"]
@@ -6,6 +6,7 @@ from pydantic import BaseModel, ValidationError
 from jsonschema import Draft202012Validator
 import json
 import os
+from functools import lru_cache
 
 
 ModelT = TypeVar("ModelT", bound=BaseModel)
@@ -48,16 +49,25 @@ def try_validate_with_jsonschema(schema: Dict[str, Any], data: Any) -> Tuple[boo
     return (len(errors) == 0, None if not errors else errors)
 
 
+@lru_cache(maxsize=None)
+def _cached_schema_validator(path: str) -> Tuple[Dict[str, Any], Draft202012Validator]:
+    # Agents are constructed per activity call, so without this every conversation turn
+    # re-read the schema file and rebuilt its validator. Schemas only change with a deploy.
+    schema = load_json_schema_from_file(path)
+    return schema, Draft202012Validator(schema)
+
+
 class SchemaValidator:
     """Simple wrapper class for JSON Schema validation."""
     
     def __init__(self, schema_path: str):
-        """Load schema from file path."""
-        self.schema = load_json_schema_from_file(schema_path)
+        """Load schema from file path and build its validator, once per path per process."""
+        self.schema, self._validator = _cached_schema_validator(schema_path)
     
     def validate(self, data: Any) -> Tuple[bool, Optional[list[str]]]:
         """Validate data against the loaded schema. Returns (is_valid, errors)."""
-        return try_validate_with_jsonschema(self.schema, data)
+        errors = [e.message for e in self._validator.iter_errors(data)]
+        return (len(errors) == 0, None if not errors else errors)
 
 
 __all__ = [
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from uvicorn_worker import UvicornWorker
+
+
+class AgentUvicornWorker(UvicornWorker):
+    """gunicorn worker with the same uvicorn settings `python main.py` uses.
+
+    The event socket pushes many small, already-batched JSON frames; per-message
+    deflate would spend CPU compressing each of them for very little saving.
+    """
+
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "loop": "uvloop",
+        "http": "httptools",
+        "ws": "websockets",
+        "ws_per_message_deflate": False,
+    }
+
+
+__all__ = ["AgentUvicornWorker"]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with validator and cache headers for pollers (e.g. the BankID QR page).
+
+    Responses carry a weak mtime/size ETag plus a short `Cache-Control`, so repeat
+    GET/HEAD polls with a matching If-None-Match get a bodiless 304. Timestamped
+    screenshots are marked immutable instead. Every request stats the file afresh
+    (Starlette already does that off the event loop), so a file rewritten in place is
+    never served with a stale length or ETag.
+    """
+
+    # Timestamped captures (t_screenshot's "<tag>-YYYYmmdd-HHMMSS.png") are never rewritten
+    _IMMUTABLE_NAME = re.compile(r"-\d{8}-\d{6}\.png$")
+    _IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def __init__(
+        self,
+        *args: Any,
+        cache_control: str = "public, max-age=1, stale-while-revalidate=2",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._cache_control = cache_control
+
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        etag = f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        immutable = self._IMMUTABLE_NAME.search(full_path) is not None
+        headers = {"etag": etag, "cache-control": self._IMMUTABLE_CACHE_CONTROL if immutable else self._cache_control}
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        # Weak comparison (RFC 9110 13.1.2): the W/ prefix is ignored on both sides
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag[2:] in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        ):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+
+
+__all__ = ["CachedStaticFiles"]
@@ -1,20 +1,151 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
+import logging
+import os
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, List, Optional
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+BROWSER_POOL_RECYCLE_AFTER = int(os.getenv("BROWSER_POOL_RECYCLE_AFTER", "100"))
+
+# Process-wide Playwright driver, set by shared_playwright() at startup
+PW: ContextVar[Playwright] = ContextVar("PW")
+
+
+@asynccontextmanager
+async def shared_playwright() -> AsyncIterator[Playwright]:
+    """Start one Playwright driver for the lifetime of the block and publish it via PW."""
+    pw = await async_playwright().start()
+    token = PW.set(pw)
+    try:
+        yield pw
+    finally:
+        PW.reset(token)
+        await pw.stop()
 
 
 @asynccontextmanager
-async def launch_browser(headless: bool = True) -> AsyncIterator[Browser]:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
+async def launch_browser(headless: bool = True, playwright: Optional[Playwright] = None) -> AsyncIterator[Browser]:
+    pw = playwright or PW.get(None)
+    if pw is None:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            try:
+                yield browser
+            finally:
+                await browser.close()
+        return
+    browser = await pw.chromium.launch(headless=headless)
+    try:
+        yield browser
+    finally:
+        await browser.close()
+
+
+class BrowserPool:
+    """Keeps launched Chromium processes warm between runs.
+
+    Runs check out a whole browser and isolate themselves with a fresh BrowserContext;
+    a browser is closed instead of returned once it has served `recycle_after` runs.
+    """
+
+    def __init__(self, *, size: int = BROWSER_POOL_SIZE, recycle_after: int = BROWSER_POOL_RECYCLE_AFTER) -> None:
+        self._size = size
+        self._recycle_after = recycle_after
+        self._idle: Dict[bool, List[Browser]] = {}
+        self._uses: Dict[Browser, int] = {}
+        self._playwright: Optional[Playwright] = None
+        self._start_lock = asyncio.Lock()
+
+    async def _driver(self) -> Playwright:
+        shared = PW.get(None)
+        if shared is not None:
+            return shared
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def _launch(self, headless: bool) -> Browser:
+        browser = await (await self._driver()).chromium.launch(headless=headless)
+        self._uses[browser] = 0
+        return browser
+
+    async def _launch_warmed(self, headless: bool) -> Browser:
+        browser = await self._launch(headless)
+        # First navigation pays renderer/V8 start-up; do it on about:blank before real traffic
+        try:
+            context = await browser.new_context()
+            page = await context.new_page()
+            await page.goto("about:blank")
+            await page.close()
+            await context.close()
+        except Exception:
+            pass
+        return browser
+
+    async def warm(self, *, headless: bool = True, count: Optional[int] = None) -> None:
+        idle = self._idle.setdefault(headless, [])
+        missing = min(count if count is not None else self._size, self._size) - len(idle)
+        if missing <= 0:
+            return
+        results = await asyncio.gather(*(self._launch_warmed(headless) for _ in range(missing)), return_exceptions=True)
+        # Keep whatever launched; a failed launch is retried lazily by browser() when needed
+        failures = [r for r in results if isinstance(r, BaseException)]
+        idle.extend(r for r in results if not isinstance(r, BaseException))
+        for exc in failures:
+            logging.getLogger(__name__).warning("Browser pool warm-up launch failed", exc_info=exc)
+
+    @asynccontextmanager
+    async def browser(self, *, headless: bool = True) -> AsyncIterator[Browser]:
+        idle = self._idle.setdefault(headless, [])
+        browser: Optional[Browser] = None
+        while idle:
+            candidate = idle.pop()
+            if candidate.is_connected():
+                browser = candidate
+                break
+            self._uses.pop(candidate, None)
+        if browser is None:
+            browser = await self._launch(headless)
+        self._uses[browser] += 1
         try:
             yield browser
         finally:
+            await self._release(browser, headless)
+
+    async def _release(self, browser: Browser, headless: bool) -> None:
+        idle = self._idle.setdefault(headless, [])
+        if browser.is_connected() and self._uses.get(browser, 0) < self._recycle_after and len(idle) < self._size:
+            idle.append(browser)
+            return
+        self._uses.pop(browser, None)
+        try:
             await browser.close()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        for idle in self._idle.values():
+            while idle:
+                browser = idle.pop()
+                self._uses.pop(browser, None)
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+browser_pool = BrowserPool()
 
 
 @asynccontextmanager
@@ -66,7 +197,6 @@ async def type_selector(page: Page, selector: str, text: str, *, timeout_ms: int
 async def screenshot_on_failure(page: Page, path: str) -> None:
     try:
         # Append timestamp suffix to avoid overwriting
-        import os, datetime
         base, ext = os.path.splitext(path)
         ts = datetime.datetime.now().strftime("-%Y%m%d-%H%M%S")
         final = f"{base}{ts}{ext}"
@@ -76,7 +206,11 @@ async def screenshot_on_failure(page: Page, path: str) -> None:
 
 
 __all__ = [
+    "PW",
+    "shared_playwright",
     "launch_browser",
+    "BrowserPool",
+    "browser_pool",
     "new_context",
     "new_page",
     "safe_goto",
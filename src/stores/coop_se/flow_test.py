@@ -8,6 +8,11 @@ from typing import Any, Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 from src.core.web_automation import launch_browser, new_context, new_page, safe_goto
 from src.agents.authentication import AuthenticationAgent
 from src.agents.shopping import ShoppingAgent
@@ -19,7 +24,7 @@ BASE_DIR = Path(__file__).resolve().parent
 
 def _read_yaml(path: Path) -> Dict[str, Any]:
     with path.open("r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 async def run_flow(query: str, headless: bool = True) -> None:
@@ -1,34 +1,104 @@
 import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 import yaml
 
+try:
+    # libyaml-backed loader; PyYAML wheels bundle it, source builds may not
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+STORES_DIR = Path('src/stores')
+
+
+@lru_cache(maxsize=32)
+def _load_store_cfg(store: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # (mtime_ns, size) is part of the cache key so an edited config.yaml is re-parsed once.
+    # A pickled sidecar stamped with the same (mtime_ns, size) lets fresh processes skip the
+    # parse entirely; an exact match rather than "pickle is newer" keeps a same-tick edit or a
+    # YAML restored with an older mtime (git checkout, cp -p) from loading a stale pickle.
+    path = STORES_DIR / store / 'config.yaml'
+    pkl_path = path.with_name(path.name + '.pkl')
+    try:
+        with pkl_path.open('rb') as f:
+            src_mtime_ns, src_size, cfg = pickle.load(f)
+        if (src_mtime_ns, src_size) == (mtime_ns, size):
+            return cfg
+    except Exception:
+        pass
+    with path.open('r') as f:
+        cfg = yaml.load(f, Loader=SafeLoader) or {}
+    try:
+        # Write-then-rename so concurrent workers never read a partial pickle
+        tmp_path = pkl_path.with_name(f'{pkl_path.name}.{os.getpid()}.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump((mtime_ns, size, cfg), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pkl_path)
+    except OSError:
+        pass  # read-only checkout: the in-process cache still applies
+    return cfg
+
+
+GLOBAL_CONFIG_PATH = Path('configs/global_config.yaml')
+
+
+@lru_cache(maxsize=1)
+def _load_global_cfg(mtime_ns: int) -> Dict[str, Any]:
+    # Keyed on mtime_ns like the store configs: agents, tools and the API all ask for the
+    # global config on hot paths, and it only changes when the file is edited.
+    with GLOBAL_CONFIG_PATH.open('r') as f:
+        cfg = yaml.load(f, Loader=SafeLoader)
+    # env overrides
+    if 'system' in cfg:
+        cfg['system']['environment'] = os.getenv('ENVIRONMENT', cfg['system'].get('environment', 'development'))
+    if 'logging' in cfg:
+        cfg['logging']['level'] = os.getenv('LOG_LEVEL', cfg['logging'].get('level', 'INFO'))
+    # store-specific env overrides
+    # COOP_DEFAULT_POSTCODE overrides stores.coop_se.default_postcode if provided
+    coop_postcode = os.getenv('COOP_DEFAULT_POSTCODE')
+    try:
+        if coop_postcode:
+            cfg.setdefault('stores', {}).setdefault('coop_se', {})['default_postcode'] = coop_postcode
+    except Exception:
+        pass
+    return cfg
+
 
 class ConfigLoader:
     @staticmethod
     def load_global_config() -> Dict[str, Any]:
-        path = Path('configs/global_config.yaml')
-        if not path.exists():
+        """Return configs/global_config.yaml with env overrides, parsed at most once per file version.
+
+        The returned dict is shared between callers; treat it as read-only.
+        """
+        try:
+            mtime_ns = os.stat(GLOBAL_CONFIG_PATH).st_mtime_ns
+        except FileNotFoundError:
             return {
                 'system': {'name': 'Shopping Agent', 'version': '0.1.0', 'environment': os.getenv('ENVIRONMENT', 'development')},
                 'logging': {'level': os.getenv('LOG_LEVEL', 'INFO')},
             }
-        with path.open('r') as f:
-            cfg = yaml.safe_load(f)
-        # env overrides
-        if 'system' in cfg:
-            cfg['system']['environment'] = os.getenv('ENVIRONMENT', cfg['system'].get('environment', 'development'))
-        if 'logging' in cfg:
-            cfg['logging']['level'] = os.getenv('LOG_LEVEL', cfg['logging'].get('level', 'INFO'))
-        # store-specific env overrides
-        # COOP_DEFAULT_POSTCODE overrides stores.coop_se.default_postcode if provided
-        coop_postcode = os.getenv('COOP_DEFAULT_POSTCODE')
-        try:
-            if coop_postcode:
-                cfg.setdefault('stores', {}).setdefault('coop_se', {})['default_postcode'] = coop_postcode
-        except Exception:
-            pass
-        return cfg
+        return _load_global_cfg(mtime_ns)
 
+    @staticmethod
+    def load_store_config(store: str) -> Dict[str, Any]:
+        """Return src/stores/<store>/config.yaml, parsed at most once per file version.
+
+        The returned dict is shared between callers; treat it as read-only.
+        """
+        path = STORES_DIR / store / 'config.yaml'
+        st = os.stat(path)
+        return _load_store_cfg(store, st.st_mtime_ns, st.st_size)
 
+    @staticmethod
+    def load_all_store_configs() -> Dict[str, Dict[str, Any]]:
+        """Parse every src/stores/*/config.yaml (warming the per-store cache), keyed by store name."""
+        return {
+            path.parent.name: ConfigLoader.load_store_config(path.parent.name)
+            for path in sorted(STORES_DIR.glob('*/config.yaml'))
+        }
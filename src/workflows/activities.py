@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 
 from temporalio import activity
 
@@ -9,7 +10,30 @@ from src.agents.authentication import AuthenticationAgent
 from src.agents.shopping import ShoppingAgent
 from src.agents.conversation import ConversationAgent
 from src.agents.tools import ToolEnv
-from src.core.web_automation import launch_browser, new_context, new_page, safe_goto
+from src.core.web_automation import browser_pool, new_context, new_page, safe_goto
+from src.utils.config_loader import ConfigLoader
+
+
+@asynccontextmanager
+async def _prepared_env(store: str, *, headless: bool, run_id: str) -> AsyncIterator[ToolEnv]:
+    """Check out a pooled browser, open a fresh context/page on the store's start URL and yield a ToolEnv."""
+    # Resolve the start URL while the browser/context/page are being set up
+    base_url_task = asyncio.create_task(_base_url_for_store(store))
+    try:
+        async with browser_pool.browser(headless=headless) as browser:
+            async with new_context(browser) as ctx:
+                async with new_page(ctx) as page:
+                    await safe_goto(page, await base_url_task)
+                    yield ToolEnv(page=page, store=store, run_id=run_id)
+    finally:
+        # Also reached when browser checkout fails before the task was awaited: cancel and
+        # retrieve it so its outcome is never left unobserved
+        if not base_url_task.done():
+            base_url_task.cancel()
+        # asyncio.wait never raises the task's own error but still lets our cancellation through
+        await asyncio.wait([base_url_task])
+        if not base_url_task.cancelled():
+            base_url_task.exception()
 
 
 @activity.defn
@@ -21,13 +45,8 @@ async def run_authentication_activity(payload: Dict[str, Any]) -> Dict[str, Any]
     workflow_id = payload.get("workflow_id") or "authentication"
 
     agent = AuthenticationAgent(store=store)
-    async with launch_browser(headless=headless) as browser:
-        async with new_context(browser) as ctx:
-            async with new_page(ctx) as page:
-                await safe_goto(page, _base_url_for_store(store))
-                env = ToolEnv(page=page, store=store, run_id=workflow_id)
-                result = await agent.run(goal=f"Authenticate to {store} using {login_method}", env=env, debug=debug)
-                return result
+    async with _prepared_env(store, headless=headless, run_id=workflow_id) as env:
+        return await agent.run(goal=f"Authenticate to {store} using {login_method}", env=env, debug=debug)
 
 
 @activity.defn
@@ -38,20 +57,15 @@ async def run_shopping_activity(payload: Dict[str, Any]) -> Dict[str, Any]:
     workflow_id = payload.get("workflow_id") or "shopping"
 
     agent = ShoppingAgent(store=store)
-    async with launch_browser(headless=headless) as browser:
-        async with new_context(browser) as ctx:
-            async with new_page(ctx) as page:
-                await safe_goto(page, _base_url_for_store(store))
-                env = ToolEnv(page=page, store=store, run_id=workflow_id)
-                shopping_list = (payload.get("shopping_list") or "").strip()
-                if shopping_list:
-                    goal = f"Shop the following items: {shopping_list}. Add exactly 1 unit of each, then open the cart."
-                else:
-                    goal = "Find 'mjölk', add 1 unit to cart, then open the cart."
-                # Ensure a clean context per run: new browser context already isolates storage.
-                # Also tag events with workflow_id to correlate in UI if needed.
-                result = await agent.run(goal=goal, env=env, debug=debug)
-                return result
+    shopping_list = (payload.get("shopping_list") or "").strip()
+    if shopping_list:
+        goal = f"Shop the following items: {shopping_list}. Add exactly 1 unit of each, then open the cart."
+    else:
+        goal = "Find 'mjölk', add 1 unit to cart, then open the cart."
+    # Ensure a clean context per run: new browser context already isolates storage.
+    # Also tag events with workflow_id to correlate in UI if needed.
+    async with _prepared_env(store, headless=headless, run_id=workflow_id) as env:
+        return await agent.run(goal=goal, env=env, debug=debug)
 
 
 @activity.defn
@@ -75,10 +89,13 @@ async def run_conversation_activity(payload: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
-def _base_url_for_store(store: str) -> str:
-    # Lightweight lookup to avoid importing yaml/config here
-    if store == "coop_se":
-        return "https://www.coop.se/"
-    return "https://www.coop.se/"
+async def _base_url_for_store(store: str) -> str:
+    # Store config is cached per file version; the stat (and parse on a miss) runs off-loop
+    try:
+        cfg = await asyncio.to_thread(ConfigLoader.load_store_config, store)
+        base_url = cfg.get("base_url")
+    except FileNotFoundError:
+        base_url = None
+    return base_url or "https://www.coop.se/"
 
 
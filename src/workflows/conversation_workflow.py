@@ -50,8 +50,7 @@ class ConversationWorkflow:
         })
         
         # Truncate history to last 50 messages
-        if len(self.state.conversation_history) > 50:
-            self.state.conversation_history = self.state.conversation_history[-50:]
+        del self.state.conversation_history[:-50]  # in place; no-op when already short
         
         # Run ConversationAgent
         decision = await workflow.execute_activity(
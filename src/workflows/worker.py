@@ -4,10 +4,18 @@ import asyncio
 import os
 import logging
 
+try:
+    # libuv-backed loop; installed with uvicorn[standard] everywhere but Windows
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None  # type: ignore[assignment]
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from src.core.events import close_events
 from src.core.logger import setup_logging
+from src.core.openai_client import close_openai_client
+from src.core.web_automation import browser_pool, shared_playwright
 from .activities import run_authentication_activity, run_shopping_activity, run_conversation_activity
 from .auth_workflow import AuthenticationWorkflow
 from .shopping_workflow import ShoppingWorkflow
@@ -32,10 +40,28 @@ async def main() -> None:
         activities=[run_authentication_activity, run_shopping_activity, run_conversation_activity],
     )
 
-    await worker.run()
+    # One Playwright driver for every activity; tasks spawned by the worker inherit PW
+    async with shared_playwright():
+        # Launch Chromium up front so the first activity doesn't pay the cold start
+        # A failed warm-up must not keep the worker from polling: activities launch lazily
+        try:
+            await browser_pool.warm(headless=os.environ.get("BROWSER_POOL_HEADLESS", "true").lower() == "true")
+        except Exception:
+            logging.getLogger(__name__).warning("Browser pool warm-up failed; launching on demand", exc_info=True)
+        try:
+            await worker.run()
+        finally:
+            await close_events()
+            await close_openai_client()
+            await browser_pool.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Activities (LLM calls, Playwright, Redis) all run on this loop; workflow code runs in
+    # Temporal's own deterministic loop and is unaffected
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
 